@@ -7,9 +7,16 @@
 # Author: Simon Klenk 2025
 # License: MIT - See the LICENSE file in the project directory for the full license text.
 import uasyncio as asyncio
-from collections import deque
 import sys
 
+class QueueFull(Exception):
+    """Raised by AsyncQueue.put_nowait() when the queue is full."""
+    pass
+
+class QueueEmpty(Exception):
+    """Raised by AsyncQueue.get_nowait() when the queue is empty."""
+    pass
+
 class AsyncQueue:
     """
     An asynchronous queue implementation similar to asyncio.Queue,
@@ -29,62 +36,130 @@ class AsyncQueue:
 
         self._maxsize = maxsize
         
-        # Determine the internal maxlen for the collections.deque.
-        # This is important for MicroPython where a truly unbounded deque might be problematic.
+        # Determine the internal capacity of the ring buffer.
+        # This is important for MicroPython where a truly unbounded buffer might be problematic.
         if maxsize > 0:
-            deque_internal_maxlen = maxsize
+            capacity = maxsize
         elif maxsize == 0:
-            deque_internal_maxlen = 20 # A practical default for MicroPython.
-            print(f"Warning: AsyncQueue initialized with maxsize=0. Using internal deque maxlen of {deque_internal_maxlen} due to MicroPython considerations.")
-
-        self._queue = deque((), deque_internal_maxlen) 
+            capacity = 20 # A practical default for MicroPython.
+            print(f"Warning: AsyncQueue initialized with maxsize=0. Using internal capacity of {capacity} due to MicroPython considerations.")
+
+        # Preallocated ring buffer: all slots are created once, put/get never allocate.
+        self._buf = [None] * capacity
+        self._capacity = capacity
+        # For power-of-two capacities the index wrap is a single bitwise AND.
+        self._mask = capacity - 1 if capacity & (capacity - 1) == 0 else 0
+        self._head = 0 # Index of the oldest item
+        self._tail = 0 # Index of the next free slot
+        self._count = 0
         
-        # Events to signal when items are available (for get) or space is available (for put).
+        # Events to wake coroutines waiting for an item (get) or for space (put).
+        # They do not mirror the queue state: an event is only set() while its waiter
+        # counter below is non-zero, and cleared as soon as the queue becomes empty
+        # (_get_event) or full (_put_event). Waiters re-check _count after waking, so
+        # an event that is clear although items/space exist is harmless - nobody
+        # waits on it, since get()/put() only wait when the queue is empty/full.
         self._get_event = asyncio.Event()
         self._put_event = asyncio.Event()
+        self._put_event.set() # The queue starts out empty, so there is space
+
+        # Number of coroutines currently parked on each event. set() is skipped when
+        # nobody waits, which saves an event loop round-trip per operation.
+        self._getters_waiting = 0
+        self._putters_waiting = 0
+
+    def put_nowait(self, item):
+        """
+        Puts an item into the queue without waiting.
+        :param item: The item to put into the queue.
+        :raises QueueFull: If the queue is full (only possible with maxsize > 0).
+        """
+        if self._maxsize > 0 and self._count >= self._maxsize:
+            raise QueueFull("AsyncQueue is full")
+
+        if self._count == self._capacity:
+            # Only reachable with maxsize=0: drop the oldest item, like a bounded deque.
+            self._buf[self._head] = None
+            self._head = (self._head + 1) & self._mask if self._mask else (self._head + 1) % self._capacity
+            self._count -= 1
+
+        self._buf[self._tail] = item # Add the item to the ring buffer
+        self._tail = (self._tail + 1) & self._mask if self._mask else (self._tail + 1) % self._capacity
+        self._count += 1
+        if self._getters_waiting > 0:
+            self._get_event.set() # Signal that an item is available for 'get'
+        if self._maxsize > 0 and self._count >= self._maxsize:
+            self._put_event.clear() # The queue just became full
+
+    def get_nowait(self):
+        """
+        Removes and returns an item from the queue without waiting.
+        :return: The item removed from the queue.
+        :raises QueueEmpty: If the queue is empty.
+        """
+        if not self._count:
+            raise QueueEmpty("AsyncQueue is empty")
+
+        item = self._buf[self._head] # Take the oldest item from the ring buffer
+        self._buf[self._head] = None # Drop the reference so it can be collected
+        self._head = (self._head + 1) & self._mask if self._mask else (self._head + 1) % self._capacity
+        self._count -= 1
+        if self._putters_waiting > 0:
+            self._put_event.set() # Signal that space is available for 'put'
+        if not self._count:
+            self._get_event.clear() # The queue just became empty
+        return item
 
     async def put(self, item):
         """
         Puts an item into the queue.
         If the queue is full (and maxsize > 0), this coroutine will wait until space is available.
+        If there is space, the item is stored right away without yielding to the event loop.
         :param item: The item to put into the queue.
         """
         # If maxsize is greater than 0 and the queue is full, wait for space.
-        while self._maxsize > 0 and len(self._queue) >= self._maxsize:
-            self._put_event.clear() # Clear the event to wait for space
-            await self._put_event.wait() # Wait until an item is removed
-        
-        self._queue.append(item) # Add the item to the deque
-        self._get_event.set() # Signal that an item is available for 'get'
+        # The event is only cleared when the queue actually becomes full (see put_nowait),
+        # so a waiter can never miss a wakeup from a concurrent 'get'.
+        while self._maxsize > 0 and self._count >= self._maxsize:
+            self._putters_waiting += 1
+            try:
+                await self._put_event.wait() # Wait until an item is removed
+            finally:
+                self._putters_waiting -= 1
+
+        self.put_nowait(item)
 
     async def get(self):
         """
         Removes and returns an item from the queue.
         If the queue is empty, this coroutine will wait until an item is available.
+        If an item is available, it is returned right away without yielding to the event loop.
         :return: The item removed from the queue.
         """
         # If the queue is empty, wait for an item to be put.
-        while not self._queue:
-            self._get_event.clear() # Clear the event to wait for an item
-            await self._get_event.wait() # Wait until an item is available
-        
-        item = self._queue.popleft() # Remove the oldest item from the deque
-        self._put_event.set() # Signal that space is available for 'put'
-        return item
+        # The event is only cleared when the queue actually becomes empty (see get_nowait).
+        while not self._count:
+            self._getters_waiting += 1
+            try:
+                await self._get_event.wait() # Wait until an item is available
+            finally:
+                self._getters_waiting -= 1
+
+        return self.get_nowait()
 
     def qsize(self):
         """
         Returns the number of items currently in the queue.
         :return: The current size of the queue.
         """
-        return len(self._queue)
+        return self._count
 
     def empty(self):
         """
         Returns True if the queue is empty, False otherwise.
         :return: True if empty, False otherwise.
         """
-        return len(self._queue) == 0
+        return self._count == 0
 
     def full(self):
         """
@@ -92,7 +167,7 @@ class AsyncQueue:
         If the queue was initialized with maxsize=0, then full() is never True.
         :return: True if full, False otherwise.
         """
-        return self._maxsize > 0 and len(self._queue) >= self._maxsize
+        return self._maxsize > 0 and self._count >= self._maxsize
 
 # --- Example Usage ---
 
@@ -104,7 +179,7 @@ async def producer(queue, name, count):
     :param count: Number of items to produce.
     """
     for i in range(count):
-        item = f"Message {i} from {name}"
+        item = (name, i) # A tuple of existing objects: no string building per message
         print(f"[{name}] Producing: {item}")
         await queue.put(item) # Put item into the queue, waiting if full
         await asyncio.sleep_ms(100 + i * 10) # Simulate work
@@ -1,6 +1,6 @@
-# wifi_connector_sync.py
+# connect_wifi.py
 #
-# This module provides synchronous functionality to connect a MicroPython device
+# This module provides asynchronous functionality to connect a MicroPython device
 # to a Wi-Fi network. It reads credentials from a file, decodes the password,
 # and attempts to establish a connection, reporting the status and assigned IP address.
 #
@@ -8,6 +8,7 @@
 # License: MIT - See the LICENSE file in the project directory for the full license text.
 
 import time
+import uasyncio as asyncio
 import network
 import ubinascii
 from microdot import Microdot, send_file, redirect, Response
@@ -15,25 +16,29 @@ from microdot import Microdot, send_file, redirect, Response
 app = Microdot()
 Response.default_content_type = 'application/json'
 
+WIFI_CONNECT_TIMEOUT_MS = 15000 # Maximum time to wait for the Wi-Fi association
+# wlan.status() codes after which waiting any longer is pointless.
+_WIFI_FAIL_STATUS = (network.STAT_WRONG_PASSWORD, network.STAT_NO_AP_FOUND, network.STAT_CONNECT_FAIL)
 
-def connect_wifi():
+# The single station interface, shared with the web server (network.WLAN returns the same object anyway).
+sta_if = network.WLAN(network.STA_IF)
+
+_wifi_creds = None # (ssid, password) after the first successful read; a changed file takes effect after a reboot
+
+
+def _read_credentials():
     """
-    Synchronously connects the MicroPython device to a Wi-Fi network.
-    It reads the SSID and base64-encoded password from 'wifi_credentials.txt',
-    decodes the password, and attempts to establish a Wi-Fi connection.
-    It waits for a connection and returns the assigned IP address upon success,
-    or None if the connection fails. This function will block until a connection
-    is established or the timeout is reached.
+    Reads the SSID and base64-encoded password from 'wifi_credentials.txt' and
+    decodes the password. Returns (ssid, password), or None on failure.
     """
-    ssid = None
-    encoded_pw = None
-
     # Attempt to read Wi-Fi credentiaals from the 'wifi_credentials.txt' file.
     try:
         with open('wifi_credentials.txt', 'r') as f:
             lines = f.readlines()
-            ssid = lines[0].strip().split(': ')[1]
-            encoded_pw = lines[1].strip().split(': ')[1]
+            ssid = lines[0].strip().partition(': ')[2]
+            encoded_pw = lines[1].strip().partition(': ')[2]
+        if not ssid or not encoded_pw:
+            raise IndexError
     except OSError as e:
         print(f'❌ Error reading wifi_credentials.txt: {e}. Make sure the file exists and is accessible.')
         return None
@@ -44,31 +49,53 @@ def connect_wifi():
         print(f'❌ An unexpected error occurred while reading credentials: {e}')
         return None
 
-    password = None
     # Attempt to decode the base64-encoded password.
     try:
         password = ubinascii.a2b_base64(encoded_pw).decode('utf-8')
     except Exception as e:
         print(f'❌ Failed to decode password: {e}. Ensure the password in the file is valid base64.')
         return None
+    return ssid, password
+
 
-    # Initialize WLAN interface in station mode.
-    wlan = network.WLAN(network.STA_IF)
+async def connect_wifi():
+    """
+    Asynchronously connects the MicroPython device to a Wi-Fi network.
+    It reads the SSID and base64-encoded password from 'wifi_credentials.txt'
+    (cached after the first successful read), decodes the password, and attempts to establish a Wi-Fi connection.
+    It waits for a connection and returns the assigned IP address upon success,
+    or None if the connection fails. While waiting for the association, other
+    coroutines (e.g. the display) keep running until a connection is established,
+    the access point rejects the connection or the timeout is reached.
+    """
+    global _wifi_creds
+    # The credentials are read and decoded only once; reconnects reuse them.
+    if _wifi_creds is None:
+        _wifi_creds = _read_credentials()
+        if _wifi_creds is None:
+            return None
+    ssid, password = _wifi_creds
+
+    # Activate the WLAN interface in station mode.
+    wlan = sta_if
     wlan.active(True)
     wlan.connect(ssid, password)
     print(f'🌐 Connecting to {ssid}...')
 
     # Wait for the connection to be established, with a timeout.
-    while True:
-        if wlan.isconnected():
-            break
-        time.sleep(0.5)
-
-    # Check if the connection was successful.
-    if not wlan.isconnected():
-        wlan.active(False)
-        print('❌ Connection failed.')
-        return None
+    # Poll quickly at first and back off, so a fast association is detected within
+    # a few milliseconds while an unreachable AP does not hang the device forever.
+    # Definitive failure codes end the wait early instead of running into the timeout.
+    deadline = time.ticks_add(time.ticks_ms(), WIFI_CONNECT_TIMEOUT_MS)
+    delay = 10
+    while not wlan.isconnected():
+        status = wlan.status()
+        if status in _WIFI_FAIL_STATUS or time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+            wlan.active(False)
+            print(f'❌ Connection failed (status {status}).')
+            return None
+        await asyncio.sleep_ms(delay)
+        delay = min(delay * 2, 200)
 
     # If connected, get the IP address.
     ip = wlan.ifconfig()[0]
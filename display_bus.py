@@ -0,0 +1,57 @@
+# filename: display_bus.py
+# ----------------------------------------------------------------------
+# Gemeinsamer Zugriff auf das SH1106-Display (I2C-Bus + Treiber).
+# Alle Display-Manager teilen sich eine Instanz: einmalige Init-Sequenz
+# und nur ein 1-KB-Framebuffer im RAM.
+# ----------------------------------------------------------------------
+from machine import Pin, I2C
+import sh1106
+from micropython import const
+
+# --- KONFIGURATION ---
+DISPLAY_WIDTH = const(128)
+DISPLAY_HEIGHT = const(64)
+I2C_ADDR = const(0x3c)
+SDA_PIN = const(16)
+SCL_PIN = const(17)
+I2C_FREQS = (1_000_000, 700_000) # Hardware-I2C; Rückfall, falls das Panel 1 MHz nicht schafft
+# --------------------------------------
+
+_display = None
+
+def _init_i2c():
+    """
+    Hardware-I2C mit der ersten Frequenz aus I2C_FREQS, bei der das Display
+    im Scan antwortet. Gibt (i2c, None) oder (None, gefundene Geräte) zurück.
+    """
+    devices = []
+    for freq in I2C_FREQS:
+        i2c = I2C(0, scl=Pin(SCL_PIN), sda=Pin(SDA_PIN), freq=freq)
+        devices = i2c.scan()
+        if I2C_ADDR in devices:
+            return i2c, None
+    return None, devices
+
+def get_display():
+    """
+    Liefert den gemeinsamen SH1106-Treiber (180° gedreht).
+    Beim ersten Aufruf werden I2C und Display initialisiert.
+    """
+    global _display
+    if _display is None:
+        i2c, devices = _init_i2c()
+        if i2c is None:
+            raise OSError(
+                f"I2C-Adresse {hex(I2C_ADDR)} nicht gefunden. Gefunden: {[hex(d) for d in devices]}"
+            )
+        _display = sh1106.SH1106_I2C(
+            DISPLAY_WIDTH, DISPLAY_HEIGHT, i2c, addr=I2C_ADDR, rotate=180
+        )
+    return _display
+
+def band_pages(y_start, height):
+    """Bitmaske der SH1106-Pages, die das Band y_start..y_start+height berühren."""
+    mask = 0
+    for page in range(y_start // 8, (y_start + height - 1) // 8 + 1):
+        mask |= 1 << page
+    return mask
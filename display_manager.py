@@ -1,25 +1,59 @@
 # filename: display_manager.py
-from machine import Pin, I2C
 import uasyncio as asyncio
-import sh1106
-import framebuf
+import display_bus
+from framebuf import FrameBuffer, MONO_VLSB
 import _thread
 import utime
-import math
+import micropython
+from micropython import const
 
 # --- KONFIGURATION ---
-DISPLAY_WIDTH = 128
-DISPLAY_HEIGHT = 64
-I2C_ADDR = 0x3c
-SDA_PIN = 16
-SCL_PIN = 17
-SCROLL_SPEED = 3       # Pixel pro Schritt
-SCROLL_DELAY_MS = 1    # Millisekunden zwischen Frames (Steuert die FPS)
+DISPLAY_WIDTH = const(128)
+DISPLAY_HEIGHT = const(64)
+SCROLL_SPEED = const(3) # Pixel pro Schritt
+SCROLL_DELAY_MS = const(16) # Millisekunden zwischen Frames (~60 FPS, mehr schafft das SH1106 nicht)
 # --- NEUE SKALIERUNGS KONFIGURATION ---
 SCALE_FACTOR_WIDTH = 1.5      # Skalierungsfaktor für die Breite
-SCALE_FACTOR_HEIGHT = 6        # Skalierungsfaktor für die Höhe (8 * 8 = 64)
+SCALE_FACTOR_HEIGHT = const(6) # Skalierungsfaktor für die Höhe (8 * 8 = 64)
+MAX_TEXT_LENGTH = const(64)    # Maximale Zeichenzahl; längere Texte werden gekürzt (mit Log-Meldung)
+FB_CACHE_SIZE = const(4)       # Anzahl gecachter skalierter Texte (Puffer passend zur Textlänge)
+EVENT_COALESCE_MS = const(50)  # Zeitfenster, in dem schnell folgende Display-Events zusammengefasst werden
+# --- DARSTELLUNGS-STRATEGIE ---
+# 0: skalierter 8x8-Font, gerendert auf Core 1 (DisplayManager)
+# 1: Roboto-Vektorschrift über writer.Writer, asyncio auf Core 0 (VectorFontDisplayManager)
+USE_VECTOR_FONT = const(0) # const: der nicht gewählte Zweig wird nicht kompiliert
+VECTOR_SCROLL_SPEED = const(4) # Pixel pro Schritt
+VECTOR_SCROLL_DELAY_MS = const(30) # Millisekunden zwischen Frames (Trade-off, siehe _render_text)
+# Debug-Ausgaben pro Event (blockierende UART-Ausgabe); const(0) entfernt sie beim Kompilieren
+_DEBUG = const(0)
 # --------------------------------------
 
+# Vorgefertigte Leerzeichen-Strings für das Auffüllen auf ein Vielfaches von 8
+_SPACES = ("", " ", "  ", "   ", "    ", "     ", "      ", "       ")
+
+# Optionales natives Modul (modscale/, als .mpy gebaut); sonst Python/Viper-Pfad
+try:
+    from modscale import scale_framebuf as _native_scale_framebuf
+except ImportError:
+    _native_scale_framebuf = None
+
+@micropython.viper
+def _pack_column(buf_dest: ptr8, column: ptr8, x: int, width_dest: int, pages: int):
+    """Schreibt eine gestreckte Spalte (pages Bytes) mit Stride width_dest ab Spalte x."""
+    offset = x
+    for p in range(pages):
+        buf_dest[offset] = column[p]
+        offset += width_dest
+
+@micropython.viper
+def _copy_columns(dst: ptr8, dst_stride: int, dst_x: int, src: ptr8, src_stride: int, src_x: int, count: int, pages: int):
+    """Kopiert count Spalten (MONO_VLSB, pages Bytes hoch) von src_x nach dst_x."""
+    for p in range(pages):
+        d = p * dst_stride + dst_x
+        s = p * src_stride + src_x
+        for i in range(count):
+            dst[d + i] = src[s + i]
+
 class DisplayInitializationError(Exception):
     """Custom exception for display initialization errors."""
     pass
@@ -37,96 +71,212 @@ class DisplayManager:
         self.display = None
         
         # --- MULTI-CORE VARIABLEN ---
-        self._core1_text = ""                
-        self._core1_lock = _thread.allocate_lock() 
+        # Single-Producer/Single-Consumer ohne Lock: Core 0 veröffentlicht ein
+        # unveränderliches Tupel (text, power_on) und erhöht danach die Sequenznummer.
+        # Attribut-Zuweisungen sind atomar, Core 1 liest nur bei geänderter Nummer.
+        self._core1_pending = ("", False)
+        self._core1_seq = 0
         self._core1_running = False          
-        self._core1_power_on = False # NEU: Steuert den Stromstatus des Displays
+        # Nur für Start/Ende des Threads (selten), nicht pro Frame: verhindert,
+        # dass Core 1 endet, während Core 0 gerade neuen Text veröffentlicht
+        self._core1_start_lock = _thread.allocate_lock()
+        # ---------------------------
+
+        # Lookup-Tabelle für scale_framebuf (wird beim ersten Skalieren gebaut)
+        self._column_table = None
+        self._column_table_height = 0
+
+        # --- VORALLOKIERTE PUFFER (kein gc_alloc beim Textwechsel) ---
+        base_width_max = MAX_TEXT_LENGTH * 8
+        self._fb_base_buf = bytearray(base_width_max)
+        # LRU-Cache der skalierten Framebuffer: {(text, breite, höhe): (fb_scaled, buf_scaled)}
+        # Jeder Eintrag besitzt einen Puffer passend zu seinem Text. Beim Verdrängen
+        # wird der alte Puffer wiederverwendet, wenn er groß genug ist.
+        self._fb_cache = {}
+        self._fb_cache_order = [] # Ältester Schlüssel zuerst
+        # Ein-Eintrag-Cache für _calculate_scaled_dims: {text: dims}
+        self._dims_cache = {}
+        # Spaltenpuffer für den Scroll-Schritt (SCROLL_SPEED Spalten, volle Höhe):
+        # wird pro Frame befüllt und geblittet, statt jedes Mal eine Sicht anzulegen
+        self._col_buf = bytearray(SCROLL_SPEED * (DISPLAY_HEIGHT >> 3))
+        self._col_fb = FrameBuffer(self._col_buf, SCROLL_SPEED, DISPLAY_HEIGHT, MONO_VLSB)
         # ---------------------------
 
         try:
-            # I2C Initialisierung (etc.) ...
-            self.i2c = I2C(0, scl=Pin(SCL_PIN), sda=Pin(SDA_PIN), freq=400000)
-
-            devices = self.i2c.scan()
-            if not devices or I2C_ADDR not in devices:
-                raise DisplayInitializationError(
-                    f"I2C-Adresse {hex(I2C_ADDR)} nicht gefunden. Gefunden: {[hex(d) for d in devices]}"
-                )
-
-            # Display initialisieren
-            self.display = sh1106.SH1106_I2C(
-                DISPLAY_WIDTH, DISPLAY_HEIGHT, self.i2c, addr=I2C_ADDR, rotate=180
-            )
+            # Gemeinsames Display (I2C + SH1106) holen, wird nur einmal initialisiert
+            self.display = display_bus.get_display()
+            self.i2c = self.display.i2c
             self.display.fill(0)
             self.display.show()
             self.display.poweroff()
+
+            # Direkter Zugriff auf den Render-Puffer des Displays (MONO_VLSB,
+            # eine Page = DISPLAY_WIDTH Bytes) zum Löschen des Textbands per memcpy
+            self._fb_bytes = memoryview(self.display.renderbuf)
+            self._zero_strip = memoryview(bytes(DISPLAY_WIDTH * ((int(8 * SCALE_FACTOR_HEIGHT) + 7) >> 3)))
             # Der Core 1 Thread wird später bei Bedarf gestartet.
 
         except Exception as e:
             raise DisplayInitializationError(f"Error initializing the display: {e}")
 
     # -------------------------
-    # Framebuffer-Skalierungslogik (unverändert)
+    # Framebuffer-Skalierungslogik
     # -------------------------
-    # ... (scale_framebuf-Methode bleibt hier unverändert) ...
 
-    def scale_framebuf(self, fb_source, width_source, height_source, width_dest, height_dest):
+    def _build_column_table(self, height_dest):
         """
-        Skaliert den Framebuffer:
-        - Vertikal: normal stretchen
-        - Horizontal: Anti-Aliased-Skalierung für dünnere Schrift
+        Baut die Lookup-Tabelle für die vertikale Streckung:
+        Quell-Byte (8px-Spalte, MONO_VLSB) -> gestreckte Spalte als Page-Bytes.
         """
-        # ... (Implementierung wie im Originalcode)
-        try:
-            fb_dest = framebuf.FrameBuffer(
-                bytearray(math.ceil(width_dest * height_dest / 8)),
-                width_dest,
-                height_dest,
-                framebuf.MONO_HLSB
-            )
-
-            x_ratio = width_source / width_dest
-            y_ratio = height_source / height_dest
-
+        pages = (height_dest + 7) >> 3
+        table = []
+        for src_byte in range(256):
+            bits = 0
             for y in range(height_dest):
-                py = int(y * y_ratio)
-
-                for x in range(width_dest):
-                    # horizontale Interpolation (macht die Schrift dünner!)
-                    fx = x * x_ratio
-                    x0 = int(fx)
-                    x1 = min(x0 + 1, width_source - 1)
-
-                    p0 = fb_source.pixel(x0, py)
-                    p1 = fb_source.pixel(x1, py)
-
-                    # Linear interpolieren → dünner, weicher
-                    mix = (fx - x0)
-                    val = 1 if (p0 * (1 - mix) + p1 * mix) > 0.5 else 0
+                if src_byte & (1 << (y * 8 // height_dest)):
+                    bits |= 1 << y
+            table.append(bytes((bits >> (8 * p)) & 0xFF for p in range(pages)))
+        return table
 
-                    fb_dest.pixel(x, y, val)
-
-            return fb_dest
+    def scale_framebuf_into(self, buf_source, width_source, height_source, width_dest, height_dest, buf_dest):
+        """
+        Skaliert den Framebuffer byteweise in einen vorhandenen Puffer:
+        - Quelle: MONO_VLSB, 8 Pixel hoch -> ein Byte pro Spalte
+        - Vertikal: Lookup-Tabelle streckt jedes Quell-Byte auf height_dest Pixel
+        - Horizontal: Nearest-Neighbor (entspricht der alten 0.5-Schwelle)
+        Ziel ist ebenfalls MONO_VLSB. Jedes Byte im Bereich width_dest * pages
+        wird beschrieben, ein vorheriges Löschen des Puffers ist daher unnötig.
+        """
+        try:
+            if height_source != 8:
+                raise ValueError(f"Quellhöhe muss 8 sein, ist {height_source}")
+
+            pages = (height_dest + 7) >> 3
+            if len(buf_dest) < width_dest * pages:
+                raise ValueError(f"Zielpuffer zu klein: {len(buf_dest)} < {width_dest * pages}")
+
+            if _native_scale_framebuf is not None:
+                _native_scale_framebuf(buf_dest, buf_source, width_dest, height_dest, width_source, height_source)
+                return FrameBuffer(buf_dest, width_dest, height_dest, MONO_VLSB)
+
+            if self._column_table_height != height_dest:
+                self._column_table = self._build_column_table(height_dest)
+                self._column_table_height = height_dest
+            table = self._column_table
+
+            # Ganzzahliges Runden von x * width_source / width_dest:
+            # sx = (2 * x * width_source + width_dest) // (2 * width_dest).
+            # Der Zähler wächst pro Spalte um 2 * width_source, so entstehen
+            # keine Float-Objekte in der Schleife.
+            step = width_source << 1
+            denom = width_dest << 1
+            num = width_dest
+            last_source = width_source - 1
+
+            for x in range(width_dest):
+                sx = num // denom
+                num += step
+                if sx > last_source:
+                    sx = last_source
+                # Spalte in die Pages des Ziels schreiben (Stride = width_dest)
+                _pack_column(buf_dest, table[buf_source[sx]], x, width_dest, pages)
+
+            return FrameBuffer(buf_dest, width_dest, height_dest, MONO_VLSB)
 
         except Exception as e:
             raise FramebufferScalingError(f"Error while scaling framebuffer: {e}")
+
+    def _get_scaled_framebuf(self, padded_text, scaled_width, scaled_height):
+        """
+        Liefert (fb_scaled, buf_scaled) für padded_text aus dem LRU-Cache.
+        Bei einem Fehlschlag wird der Text einmal gerendert und skaliert.
+        """
+        key = (padded_text, scaled_width, scaled_height)
+        entry = self._fb_cache.get(key)
+        if entry is not None:
+            self._fb_cache_order.remove(key)
+            self._fb_cache_order.append(key)
+            return entry
+
+        buf_size = scaled_width * ((scaled_height + 7) >> 3)
+        buf_scaled = None
+        if len(self._fb_cache_order) >= FB_CACHE_SIZE:
+            # Ältesten Eintrag verdrängen; sein Puffer wird weiterverwendet,
+            # wenn er für den neuen Text reicht, sonst gibt ihn der GC frei
+            buf_scaled = self._fb_cache.pop(self._fb_cache_order.pop(0))[1]
+            if len(buf_scaled) < buf_size:
+                buf_scaled = None
+        if buf_scaled is None:
+            buf_scaled = bytearray(buf_size)
+
+        base_width = len(padded_text) * 8
+        # MONO_VLSB bei 8 Pixel Höhe: genau ein Byte pro Spalte.
+        # Der Basis-Puffer ist vorallokiert, nur die FrameBuffer-Sicht ist neu.
+        buf_base = self._fb_base_buf
+        fb_base = FrameBuffer(buf_base, base_width, 8, MONO_VLSB)
+        fb_base.fill(0)
+        fb_base.text(padded_text, 0, 0, 1)
+
+        fb_scaled = self.scale_framebuf_into(
+            buf_base,
+            base_width,
+            8,
+            scaled_width,
+            scaled_height,
+            buf_scaled
+        )
+        entry = (fb_scaled, buf_scaled)
+        self._fb_cache[key] = entry
+        self._fb_cache_order.append(key)
+        return entry
     # -------------------------
 
     # -------------------------
     # NEU: Event-Behandlung (Läuft auf Core 0, ersetzt set_text)
     # -------------------------
-    def _update_text_and_power(self, new_text, power_on):
+    async def _update_text_and_power(self, new_text, power_on):
         """
         Aktualisiert Text und Power-Zustand sicher für Core 1.
         Startet den Core 1 Thread, falls nötig.
+        Texte über MAX_TEXT_LENGTH Zeichen werden hier gekürzt und gemeldet.
         """
-        with self._core1_lock:
-            self._core1_text = new_text
-            self._core1_power_on = power_on
-
-        if not self._core1_running:
+        if len(new_text) > MAX_TEXT_LENGTH:
+            print(f"[DisplayManager] Text mit {len(new_text)} Zeichen auf {MAX_TEXT_LENGTH} gekürzt.")
+            new_text = new_text[:MAX_TEXT_LENGTH]
+        # Erst das Tupel veröffentlichen, dann die Sequenznummer erhöhen
+        self._core1_pending = (new_text, power_on)
+        self._core1_seq += 1
+
+        with self._core1_start_lock:
+            if self._core1_running:
+                return
+            self._core1_running = True
+        if _DEBUG:
             print("[DisplayManager] Starte Scroll-Thread auf Core 1.")
-            _thread.start_new_thread(self._core1_scroll_thread, ())
+        # Ein gerade beendeter Thread kann Core 1 noch kurz belegen (OSError).
+        # Zwischen den Versuchen per asyncio warten, damit Core 0 weiterläuft.
+        for _ in range(10):
+            try:
+                _thread.start_new_thread(self._core1_scroll_thread, ())
+                return
+            except OSError as e:
+                error = e
+            await asyncio.sleep_ms(1)
+        # Start fehlgeschlagen: freigeben, damit das nächste Event es erneut versucht
+        with self._core1_start_lock:
+            self._core1_running = False
+        print(f"[DisplayManager] Scroll-Thread konnte nicht gestartet werden: {error}")
+
+    def _core1_try_stop(self, seen_seq):
+        """
+        Beendet den Core 1 Thread, wenn seit seen_seq nichts Neues veröffentlicht
+        wurde. Gibt True zurück, wenn der Thread enden soll.
+        """
+        with self._core1_start_lock:
+            if self._core1_seq == seen_seq:
+                self._core1_running = False
+                return True
+            return False
 
     async def handle_event(self, event):
         """Verarbeitet NEWTEXT und DELETETEXT Events."""
@@ -137,14 +287,16 @@ class DisplayManager:
             if text != self._current_text:
                 self._current_text = text
                 # Setze Text und schalte Display ein
-                self._update_text_and_power(text, True)
-                print(f"[DisplayManager] Neuer Text: '{text}'")
+                await self._update_text_and_power(text, True)
+                if _DEBUG:
+                    print(f"[DisplayManager] Neuer Text: '{text}'")
                 
         elif event_type == "DELETETEXT":
             # Schalte Display aus und setze Text auf leer
-            self._update_text_and_power("", False) 
+            await self._update_text_and_power("", False)
             self._current_text = ""
-            print("[DisplayManager] Display ausgeschaltet.")
+            if _DEBUG:
+                print("[DisplayManager] Display ausgeschaltet.")
             
         else:
             print(f"[DisplayManager] Unbekannter Event-Typ: {event_type}")
@@ -152,14 +304,18 @@ class DisplayManager:
     # -------------------------
     # Berechne skalierte Start/End-Koordinaten (unverändert)
     # -------------------------
+    @micropython.native
     def _calculate_scaled_dims(self, text):
         # ... (Implementierung wie im Originalcode)
         """Berechnet die Abmessungen des skalierten Textes."""
-        
+        dims = self._dims_cache.get(text)
+        if dims is not None:
+            return dims
+
+        # Text ist bereits in _update_text_and_power auf MAX_TEXT_LENGTH gekürzt
         # 1. Padding für den Base-Framebuffer (muss durch 8 teilbar sein)
         text_length = len(text)
-        padding_length = 8 - (text_length % 8) if text_length % 8 != 0 else 0
-        padded_text = text + " " * padding_length
+        padded_text = text + _SPACES[(-text_length) & 7]
         text_length_padded = len(padded_text)
         base_char_height = 8 # Interner Font ist 8 Pixel hoch
         base_char_width = 8  # Interner Font ist 8 Pixel breit
@@ -181,7 +337,9 @@ class DisplayManager:
             x_start = DISPLAY_WIDTH
             x_end = -scaled_width
 
-        return scaled_width, scaled_height, y_start, x_start, x_end, padded_text
+        dims = (scaled_width, scaled_height, y_start, x_start, x_end, padded_text)
+        self._dims_cache = {text: dims}
+        return dims
 
 
     # -------------------------
@@ -196,25 +354,46 @@ class DisplayManager:
         _text = ""
         _padded_text = ""
         scaled_width = scaled_height = y_start = x_start = x_end = 0
-        current_x = 0.0
-        last_frame_time = utime.ticks_ms()
+        current_x = 0 # Ganzzahl: SCROLL_SPEED ist ganzzahlig, kein int() pro Frame
+        next_frame_time = utime.ticks_ms() # Fester Frame-Takt (Deadline des nächsten Frames)
         fb_scaled = None # Der skalierte Framebuffer
+        buf_scaled = None # Der Puffer hinter fb_scaled (für Spalten-Blits)
+        full_redraw = True # Nächster Frame muss komplett gezeichnet werden
+        seen_seq = -1 # Zuletzt gelesene Sequenznummer (-1 erzwingt den ersten Read)
+        new_text, is_power_on = "", False
+        display_on = None # Zuletzt an das Display gesendeter Power-Zustand
+
+        # Lokale Bindungen: LOAD_FAST statt Dict-Lookup pro Schleifendurchlauf
+        ticks_ms = utime.ticks_ms
+        ticks_diff = utime.ticks_diff
+        ticks_add = utime.ticks_add
+        sleep_ms = utime.sleep_ms
+        render = self._render_scaled_framebuf
+        render_step = self._render_scroll_step
+        display = self.display
+        scroll_speed = SCROLL_SPEED
+        scroll_delay = SCROLL_DELAY_MS
 
         while self._core1_running:
-            # 1. Datenabruf
-            with self._core1_lock:
-                new_text = self._core1_text
-                is_power_on = self._core1_power_on # NEU: Power-Zustand abfragen
+            # 1. Datenabruf (lock-frei, nur wenn Core 0 etwas veröffentlicht hat)
+            seq = self._core1_seq
+            if seq != seen_seq:
+                seen_seq = seq
+                new_text, is_power_on = self._core1_pending
+
+            # 2. Power-Logik: I2C-Befehl nur beim Wechsel, nicht in jedem Frame
+            if is_power_on != display_on:
+                display_on = is_power_on
+                if is_power_on:
+                    display.poweron()
+                else:
+                    display.poweroff()
 
-            # 2. Power-Logik (Minimale CPU-Last bei ausgeschaltetem Display)
             if not is_power_on:
-                self.display.poweroff()
-                # Wichtig: Sehr lange Pause, um CPU-Last zu minimieren
-                utime.sleep_ms(500) 
+                # Display aus: nichts zu tun, Core 1 freigeben (Neustart durch Core 0)
+                if self._core1_try_stop(seen_seq):
+                    return
                 continue
-            
-            # Wenn eingeschaltet, sicherstellen, dass das Display an ist
-            self.display.poweron() 
 
             # 3. Textwechsel: FrameBuffer neu erstellen (Rechenintensiver Teil)
             if new_text != _text:
@@ -222,56 +401,102 @@ class DisplayManager:
                 # Dimensionen berechnen und Framebuffer neu erstellen (wie im Original)
                 # ... (Berechnung, Base FB erstellen, Skalierung)
                 (scaled_width, scaled_height, y_start, x_start, x_end, _padded_text) = self._calculate_scaled_dims(_text)
-                current_x = float(x_start)
+                current_x = x_start
 
-                base_width = len(_padded_text) * 8
-                fb_base = framebuf.FrameBuffer(bytearray(math.ceil(base_width * 8 / 8)), base_width, 8, framebuf.MONO_HLSB)
-                fb_base.fill(0)
-                fb_base.text(_padded_text, 0, 0, 1) 
-                
-                fb_scaled = self.scale_framebuf(
-                    fb_base, 
-                    base_width, 
-                    8, 
-                    scaled_width, 
-                    scaled_height
-                )
+                # Skalierten Framebuffer aus dem Cache holen (rendert nur bei neuem Text)
+                fb_scaled, buf_scaled = self._get_scaled_framebuf(_padded_text, scaled_width, scaled_height)
+                full_redraw = True
                 
                 # Statischer Text (einmaliges Rendern)
                 if x_start == x_end:
-                    self._render_scaled_framebuf(fb_scaled, y_start, int(current_x), scaled_height)
-                    utime.sleep_ms(1000)
+                    render(fb_scaled, y_start, current_x, scaled_height)
+                    # Das Bild bleibt stehen: kein weiteres I2C, Core 1 freigeben.
+                    # Neuer Text startet den Thread über _update_text_and_power neu.
+                    if self._core1_try_stop(seen_seq):
+                        return
                     continue
 
             # 4. Scroll-Logik (Nur für scrollenden Text)
             if x_start != x_end and fb_scaled:
-                now = utime.ticks_ms()
-                if utime.ticks_diff(now, last_frame_time) >= SCROLL_DELAY_MS:
-                    self._render_scaled_framebuf(fb_scaled, y_start, int(current_x), scaled_height)
-                    current_x -= SCROLL_SPEED
+                wait = ticks_diff(next_frame_time, ticks_ms())
+                if wait > 0:
+                    # Bis zum nächsten Frame-Tick schlafen statt Core 1 durchdrehen zu lassen
+                    sleep_ms(wait)
+                else:
+                    if full_redraw:
+                        render(fb_scaled, y_start, current_x, scaled_height)
+                        full_redraw = False
+                    else:
+                        # Bild um scroll_speed verschieben, nur neue Spalten zeichnen
+                        render_step(buf_scaled, scaled_width, y_start, current_x, scaled_height, scroll_speed)
+                    current_x -= scroll_speed
                     
                     if current_x <= x_end:
                         current_x = x_start
-                        utime.sleep_ms(500)
-                    
-                    last_frame_time = now
+                        full_redraw = True
+                        # Pause am Ende in 50-ms-Schritten, neuer Text beendet sie sofort
+                        for _ in range(10):
+                            if self._core1_seq != seen_seq:
+                                break
+                            sleep_ms(50)
+
+                    # Deadline um genau einen Frame weiterschieben: kein Drift durch
+                    # die Renderzeit. Liegt sie danach immer noch in der Vergangenheit
+                    # (Pause, langsames I2C), neu am aktuellen Zeitpunkt ausrichten.
+                    next_frame_time = ticks_add(next_frame_time, scroll_delay)
+                    now = ticks_ms()
+                    if ticks_diff(next_frame_time, now) <= 0:
+                        next_frame_time = ticks_add(now, scroll_delay)
             else:
                 # Wenn statisch oder kein Text, verhindere 100% Core-Auslastung
-                utime.sleep_ms(100) 
+                sleep_ms(100) 
 
 
     # -------------------------
-    # Framebuffer rendern (unverändert)
+    # Framebuffer rendern
     # -------------------------
     def _render_scaled_framebuf(self, fb_scaled, y_start, x_start, height):
         # ... (Implementierung wie im Originalcode)
         """Render-Funktion, die auf Core 1 läuft."""
         
-        self.display.fill_rect(0, y_start, DISPLAY_WIDTH, height, 0)
+        n = DISPLAY_WIDTH * ((height + 7) >> 3)
+        if y_start & 7 == 0 and n <= len(self._zero_strip):
+            # Band liegt auf Page-Grenzen: zusammenhängende Bytes, ein Slice-Copy genügt
+            start = (y_start >> 3) * DISPLAY_WIDTH
+            self._fb_bytes[start:start + n] = self._zero_strip[:n]
+        else:
+            self.display.fill_rect(0, y_start, DISPLAY_WIDTH, height, 0)
         self.display.blit(fb_scaled, x_start, y_start)
         
-        with self._core1_lock:
-            self.display.show()
+        # Nur Core 1 greift auf das Display zu, show() braucht keine Synchronisation
+        self.display.show()
+
+    def _render_scroll_step(self, buf_scaled, scaled_width, y_start, x_start, height, step):
+        """
+        Inkrementeller Scroll-Frame (Core 1): verschiebt das Display um step
+        Pixel nach links und blittet nur die rechts neu sichtbaren Spalten.
+        x_start ist die neue Position von Spalte 0 des skalierten Puffers.
+        step ist immer SCROLL_SPEED (Breite des vorallokierten Spaltenpuffers).
+        """
+        display = self.display
+        display.scroll(-step, 0)
+        display.fill_rect(DISPLAY_WIDTH - step, y_start, step, height, 0)
+
+        # Quellspalten der neuen Bildschirmspalten, auf den Puffer begrenzt
+        src = DISPLAY_WIDTH - step - x_start
+        lo = max(src, 0)
+        hi = min(src + step, scaled_width)
+        if hi > lo:
+            # Spalten lo..hi in den Spaltenpuffer kopieren (Rest bleibt leer) und blitten;
+            # unterhalb von height ist der Puffer leer, das Band darunter ebenfalls
+            self._col_fb.fill(0)
+            _copy_columns(self._col_buf, SCROLL_SPEED, lo - src, buf_scaled, scaled_width, lo,
+                          hi - lo, (height + 7) >> 3)
+            display.blit(self._col_fb, DISPLAY_WIDTH - step, y_start)
+
+        # scroll() markiert alle Pages; außerhalb des Textbands ist alles leer
+        display.pages_to_update = display_bus.band_pages(y_start, height)
+        display.show()
 
     # -------------------------
     # run-Funktion: Liest Events aus der Queue (Läuft auf Core 0)
@@ -279,10 +504,231 @@ class DisplayManager:
     async def run(self):
         """Asynchroner Task, der Events verarbeitet und das Display steuert."""
         while True:
-            print("[DisplayManager] Warte auf Event...")
+            if _DEBUG:
+                print("[DisplayManager] Warte auf Event...")
             # Warten auf ein Event (blockiert Core 0 nicht)
             event = await self._display_event_queue.get()
-            print("Display Event empfangen")
+            if _DEBUG:
+                print("Display Event empfangen")
+            # Kurz warten und nachgekommene Events zusammenfassen: NEWTEXT/DELETETEXT
+            # beschreiben den Endzustand, nur das letzte muss an Core 1 gehen
+            await asyncio.sleep_ms(EVENT_COALESCE_MS)
+            while not self._display_event_queue.empty():
+                event = self._display_event_queue.get_nowait()
             await self.handle_event(event)
 
-# Der alte 'set_text' ist nun obsolet und sollte in main.py entfernt werden.
\ No newline at end of file
+# Vektor-Variante nur kompilieren, wenn sie gewählt ist: USE_VECTOR_FONT ist const,
+# der Compiler verwirft den Block sonst komplett (kein Bytecode, kein writer/Font im RAM)
+if USE_VECTOR_FONT:
+    import writer
+    import roboto_40
+
+    class _TextStrip(FrameBuffer):
+        """
+        Off-Screen-Puffer (MONO_VLSB) für einen kompletten Text.
+        writer.Writer braucht ein FrameBuffer-Gerät mit width/height,
+        das größer als die Schrift ist.
+        """
+        def __init__(self, width, height):
+            self.width = width
+            self.height = height
+            self.buffer = bytearray(width * ((height + 7) >> 3))
+            super().__init__(self.buffer, width, height, MONO_VLSB)
+
+
+    class VectorFontDisplayManager:
+        """
+        Alternative Darstellung mit Roboto-Schrift über writer.Writer.
+        Scrollt per asyncio-Task auf Core 0; gleiche API wie DisplayManager.
+        """
+        def __init__(self, display_event_queue):
+            self._display_event_queue = display_event_queue
+            self._current_text = ""
+            self.display = None
+            self.writer = None
+            self._scroll_task = None
+            self.font = roboto_40  # Schriftart cachen
+            # Schrifthöhe ist konstant: einmal abfragen statt bei jedem Text/Frame
+            self._font_height = self.font.height()
+            self._y_start = (DISPLAY_HEIGHT - self._font_height) // 2
+            self._strip = None  # Einmal gerenderter Text (_TextStrip)
+            # Ein-Eintrag-Cache für _calculate_dims: {text: dims}
+            self._dims_cache = {}
+
+            try:
+                # 1./2. Gemeinsames Display (Hardware-I2C + SH1106) holen
+                self.display = display_bus.get_display()
+                self.i2c = self.display.i2c
+                self.display.fill(0)
+                self.display.show()
+                self.display.poweroff()
+
+                # 3. Writer initialisieren
+                self.writer = writer.Writer(self.display, self.font)
+                self.writer.wrap = False   # Kein Word Wrap
+                self.writer.col_clip = True  # Kein vertikales Scrollen
+                self._stringlen = self.writer.stringlen  # Gebundene Methode für _calculate_dims
+
+            except Exception as e:
+                raise DisplayInitializationError(f"Error initializing the display: {e}")
+
+        # -------------------------
+        # Text setzen
+        # -------------------------
+        def set_text(self, text):
+            """Setzt neuen Text und startet den Scroll-Task asynchron."""
+            if text != self._current_text:
+                self._current_text = text
+
+                # Stoppe alten Task, falls aktiv
+                if self._scroll_task and not self._scroll_task.done():
+                    self._scroll_task.cancel()
+
+                # Starte neuen Scroll-Task
+                if self.display and text:
+                    self._scroll_task = asyncio.create_task(self._scroll_task_loop())
+                elif self.display:
+                    self.display.poweroff()
+
+        async def handle_event(self, event):
+            """Verarbeitet NEWTEXT und DELETETEXT Events."""
+            event_type = event.get("type")
+
+            if event_type == "NEWTEXT":
+                self.set_text(event.get("value", ""))
+            elif event_type == "DELETETEXT":
+                self.set_text("")
+            else:
+                print(f"[DisplayManager] Unbekannter Event-Typ: {event_type}")
+
+        # -------------------------
+        # Berechne Start/End-Koordinaten
+        # -------------------------
+        def _calculate_dims(self, text):
+            dims = self._dims_cache.get(text)
+            if dims is not None:
+                return dims
+
+            y_start = self._y_start
+            text_width = self._stringlen(text)
+
+            if text_width <= DISPLAY_WIDTH:
+                x_start = (DISPLAY_WIDTH - text_width) // 2
+                x_end = x_start  # kein Scrollen nötig
+            else:
+                x_start = DISPLAY_WIDTH
+                x_end = -text_width  # Scrollen von rechts nach links
+
+            dims = (text_width, y_start, x_start, x_end)
+            self._dims_cache = {text: dims}
+            return dims
+
+        # -------------------------
+        # Scroll-Task
+        # -------------------------
+        async def _scroll_task_loop(self):
+            _text = self._current_text
+            text_width, y_start, x_start, x_end = self._calculate_dims(_text)
+            current_x = x_start
+            self._strip = self._render_strip(_text, text_width)
+            self.display.poweron()
+
+            # Statischer Text (nicht scrollend)
+            if x_start == x_end:
+                self._render_text(y_start, x_start)
+                return
+
+            # Scroll-Loop mit fester Frame-Deadline: die Dauer von show() verlängert
+            # den Frame-Abstand nicht, das Scrollen bleibt gleichmäßig
+            next_t = utime.ticks_ms()
+            while True:
+                # _render_text() enthält den blockierenden display.show() Aufruf
+                self._render_text(y_start, current_x)
+                current_x -= VECTOR_SCROLL_SPEED
+
+                if current_x <= x_end:
+                    current_x = x_start
+                    next_t = utime.ticks_add(utime.ticks_ms(), 500)
+                    await asyncio.sleep_ms(500)  # kurze Pause am Ende
+                    continue
+
+                # Delay + Eventloop-Freigabe bis zur nächsten Deadline
+                # Das `await` gibt die Kontrolle an andere Tasks ab (z.B. Webserver)
+                next_t = utime.ticks_add(next_t, VECTOR_SCROLL_DELAY_MS)
+                dt = utime.ticks_diff(next_t, utime.ticks_ms())
+                if dt > 0:
+                    await asyncio.sleep_ms(dt)
+                else:
+                    # Hinterher: neu ausrichten, aber trotzdem kurz abgeben
+                    next_t = utime.ticks_ms()
+                    await asyncio.sleep_ms(0)
+
+        # -------------------------
+        # Text rendern
+        # -------------------------
+        def _render_strip(self, text, text_width):
+            """
+            Rendert den Text einmal mit dem Writer in einen _TextStrip.
+            Pro Frame wird danach nur noch ein Ausschnitt davon geblittet,
+            statt jede Glyphe neu aus der Schrift zu zeichnen.
+            """
+            strip = _TextStrip(max(text_width, self.font.max_width()) + 1, self._font_height + 1)
+            strip_writer = writer.Writer(strip, self.font, verbose=False)
+            strip_writer.wrap = False
+            strip_writer.col_clip = True
+            strip_writer.printstring(text)
+            # Zustand des temporären Geräts wieder freigeben
+            writer.Writer.state.pop(id(strip), None)
+            return strip
+
+        def _render_text(self, y_start, x_start):
+            """
+            Render nur die Zeile, die Text enthält, spart I2C.
+            Pro Frame nur Blit + Pages senden; Writer und Writer.state werden
+            ausschließlich einmalig in _render_strip benutzt.
+            """
+            # Vorgerenderten Text blitten (framebuf schneidet links/rechts ab).
+            # Der Blit überschreibt seinen Bereich samt Hintergrund, gelöscht werden
+            # müssen nur die Teile des Bands links und rechts vom Strip.
+            strip = self._strip
+            display = self.display
+            display.blit(strip, x_start, y_start)
+            if x_start > 0:
+                display.fill_rect(0, y_start, x_start, strip.height, 0)
+            x_end = x_start + strip.width
+            if x_end < DISPLAY_WIDTH:
+                display.fill_rect(x_end, y_start, DISPLAY_WIDTH - x_end, strip.height, 0)
+
+            # --- HINWEIS ZUR PERFORMANCE ---
+            # display.show() ist eine BLOCKIERENDE I2C-Operation.
+            # Sie sendet die geänderten Pages an das Display und blockiert währenddessen
+            # den gesamten asyncio Event-Loop. _show_rows() beschränkt das auf die
+            # Pages des Textbands (ca. 5-6 statt 8 Pages pro Frame).
+            #
+            # Der Trade-off:
+            # - Niedriger VECTOR_SCROLL_DELAY_MS = Flüssiges Scrollen, aber schlechtere
+            #   Reaktionszeit für andere Tasks (z.B. Webserver).
+            # - Hoher VECTOR_SCROLL_DELAY_MS = Ruckeliges Scrollen, aber bessere
+            #   Reaktionszeit für andere Tasks.
+            self._show_rows(y_start, strip.height)
+
+        def _show_rows(self, y_start, height):
+            """
+            Überträgt nur die Pages des Bands y_start..y_start+height.
+            blit() markiert im Treiber alle Pages bis zum unteren Rand,
+            die Maske wird daher überschrieben.
+            """
+            self.display.pages_to_update = display_bus.band_pages(y_start, height)
+            self.display.show()
+
+        # -------------------------
+        # run-Funktion: Liest Events aus der Queue (Läuft auf Core 0)
+        # -------------------------
+        async def run(self):
+            """Asynchroner Task, der Events verarbeitet und den Text setzt."""
+            while True:
+                event = await self._display_event_queue.get()
+                await self.handle_event(event)
+
+    # Strategie-Auswahl: main.py nutzt immer den Namen DisplayManager
+    DisplayManager = VectorFontDisplayManager
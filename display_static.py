@@ -3,8 +3,7 @@
 # Klasse für statische 2-Zeilen-Anzeige (Core 0 only, kein Scrolling)
 # MIT 180 GRAD DREHUNG
 # ----------------------------------------------------------------------
-from machine import Pin, I2C
-import sh1106  # Der korrekte Treiber für Ihr Display
+import display_bus  # Gemeinsamer SH1106-Treiber
 import writer
 import spleen_32  # Die optimierte, schmale Schriftart (Muss vorhanden sein)
 import utime
@@ -12,9 +11,6 @@ import utime
 # --- KONFIGURATION ---
 DISPLAY_WIDTH = 128
 DISPLAY_HEIGHT = 64
-I2C_ADDR = 0x3c
-SDA_PIN = 16
-SCL_PIN = 17
 # Die Schriftart ist 32 Pixel hoch, was 2 Zeilen auf 64px ergibt.
 LINE_HEIGHT = 32
 # -------------------------------------------------------------
@@ -27,22 +23,21 @@ class StaticDisplayManager:
     def __init__(self):
         self.display = None
         self.writer = None
+        self._writer_state = None
         
         self.font = spleen_32
         
         try:
-            # 1. Hardware-I2C initialisieren
-            # Die Pin-Zuweisung für I2C ist (scl=SCL_PIN, sda=SDA_PIN)
-            self.i2c = I2C(0, scl=Pin(SCL_PIN), sda=Pin(SDA_PIN), freq=400000)
-
-            # 2. Display initialisieren
-            # WICHTIG: rotate=2 für 180 Grad Drehung!
-            self.display = sh1106.SH1106_I2C(DISPLAY_WIDTH, DISPLAY_HEIGHT, self.i2c, addr=I2C_ADDR, rotate=180)
+            # 1./2. Gemeinsames Display (Hardware-I2C + SH1106, 180° gedreht) holen
+            self.display = display_bus.get_display()
+            self.i2c = self.display.i2c
             self.display.fill(0)
             self.display.show()
             
             # 3. Writer initialisieren
             self.writer = writer.Writer(self.display, self.font)
+            # Writer() legt den Zustand des Displays an; Referenz einmal merken
+            self._writer_state = writer.Writer.state[id(self.display)]
             
             print("StaticDisplayManager: Display bereit für statische Anzeige (180° gedreht).")
 
@@ -62,26 +57,36 @@ class StaticDisplayManager:
             print("Fehler: Display ist nicht initialisiert.")
             return
 
-        # 1. Display Buffer komplett löschen
-        self.display.fill(0)
-        
-        # 2. Zeile 1 rendern (Start bei Y=0)
-        self._render_line(line1_text, y_start=0)
-        
-        # 3. Zeile 2 rendern (Start bei Y=32)
-        self._render_line(line2_text, y_start=LINE_HEIGHT)
-        
-        # 4. Daten an das Display senden
+        # Beide Zeilen immer neu zeichnen: das Display wird mit den anderen Managern
+        # geteilt, ein Text-Cache wüsste nichts von deren Zeichenoperationen.
+        # Gesendet werden je Zeile nur die Pages ihres Bands.
+        for index, text in enumerate((line1_text, line2_text)):
+            y_start = index * LINE_HEIGHT
+
+            # 1. Band der Zeile löschen
+            self.display.fill_rect(0, y_start, DISPLAY_WIDTH, LINE_HEIGHT, 0)
+
+            # 2. Zeile rendern
+            self._render_line(text, y_start)
+
+            # 3. Nur die Pages dieser Zeile an das Display senden
+            self._show_rows(y_start, LINE_HEIGHT)
+
+    def _show_rows(self, y_start, height):
+        """
+        Überträgt nur die SH1106-Pages des Bands y_start..y_start+height.
+        blit() markiert im Treiber alle Pages bis zum unteren Rand, daher
+        wird die Maske hier explizit gesetzt.
+        """
+        self.display.pages_to_update = display_bus.band_pages(y_start, height)
         self.display.show()
         
     def _render_line(self, text, y_start):
         """Hilfsfunktion, um eine einzelne Zeile in den Buffer zu rendern."""
         
-        devid = id(self.display)
-        if devid in writer.Writer.state:
-            state = writer.Writer.state[devid]
-            state.text_row = y_start
-            state.text_col = 0 # Text beginnt immer links
+        state = self._writer_state
+        state.text_row = y_start
+        state.text_col = 0 # Text beginnt immer links
         
         # Text in den Buffer drucken
         self.writer.printstring(text)
\ No newline at end of file
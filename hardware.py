@@ -9,24 +9,34 @@ _LED_ALERT_PIN = 2
 _BUTTON_ACCEPT_PIN = 15
 _BUTTON_REJECT_PIN = 14
 
-_latest_event = None
-_event_ready = False
+# Kleiner Ringpuffer für IRQ-Events, damit prellende Flanken zwischen zwei
+# Durchläufen von _button_task nicht verloren gehen (Größe: Zweierpotenz)
+_EVENT_BUF_SIZE = 4
+_events = [None] * _EVENT_BUF_SIZE
+_event_write = 0 # Anzahl geschriebener Events (nur der IRQ-Handler schreibt)
+_flag_ref = None # ThreadSafeFlag der Hardware-Instanz, weckt _button_task
 
 # Modified handler to accept pin_id directly as the first argument
 def _button_irq_handler(pin_id_from_lambda, pin_obj):
-    global _latest_event, _event_ready
+    global _event_write
     ts = utime.ticks_ms()
     # Use the pin_id_from_lambda directly
-    _latest_event = (pin_id_from_lambda, pin_obj.value(), ts)
-    _event_ready = True
+    _events[_event_write & (_EVENT_BUF_SIZE - 1)] = (pin_id_from_lambda, pin_obj.value(), ts)
+    _event_write += 1
+    _flag_ref.set()
 
 class Hardware:
     def __init__(self, event_queue):
+        global _flag_ref
         self._event_queue = event_queue
         self._led_alert = machine.Pin(_LED_ALERT_PIN, machine.Pin.OUT)
         self._button_accept = machine.Pin(_BUTTON_ACCEPT_PIN, machine.Pin.IN, machine.Pin.PULL_DOWN)
         self._button_reject = machine.Pin(_BUTTON_REJECT_PIN, machine.Pin.IN, machine.Pin.PULL_DOWN)
 
+        # Vom IRQ-Handler gesetzt; muss vor dem Registrieren der IRQs existieren
+        self._flag = asyncio.ThreadSafeFlag()
+        _flag_ref = self._flag
+
         # Use lambda functions to pass the integer pin ID along with the Pin object
         self._button_accept.irq(trigger=machine.Pin.IRQ_FALLING | machine.Pin.IRQ_RISING,
                                 handler=lambda p: _button_irq_handler(_BUTTON_ACCEPT_PIN, p))
@@ -34,14 +44,19 @@ class Hardware:
                                  handler=lambda p: _button_irq_handler(_BUTTON_REJECT_PIN, p))
 
     async def _button_task(self):
-        global _latest_event, _event_ready
         last_event_time = {}
         DEBOUNCE_MS = 200
+        event_read = 0
         while True:
-            if _event_ready:
-                _event_ready = False
-                pin_id, val, ts = _latest_event
-                if pin_id not in last_event_time or (ts - last_event_time[pin_id]) > DEBOUNCE_MS:
+            # Kein Polling: schläft, bis der IRQ-Handler das Flag setzt
+            await self._flag.wait()
+            while event_read != _event_write:
+                # Mehr als _EVENT_BUF_SIZE Events verpasst: die ältesten sind überschrieben
+                if _event_write - event_read > _EVENT_BUF_SIZE:
+                    event_read = _event_write - _EVENT_BUF_SIZE
+                pin_id, val, ts = _events[event_read & (_EVENT_BUF_SIZE - 1)]
+                event_read += 1
+                if pin_id not in last_event_time or utime.ticks_diff(ts, last_event_time[pin_id]) > DEBOUNCE_MS:
                     last_event_time[pin_id] = ts
                     if pin_id == _BUTTON_ACCEPT_PIN:
                         value = "ACCEPT"
@@ -55,9 +70,7 @@ class Hardware:
                         "type": "BUTTON_PRESSED" if val == 0 else "BUTTON_RELEASED",
                         "value": value,
                     })
-            await asyncio.sleep_ms(100)
 
     async def run(self):
-        asyncio.create_task(self._button_task())
-        while True:
-            await asyncio.sleep(1)
\ No newline at end of file
+        # Läuft direkt als Button-Task, kein zusätzlicher Keep-alive-Task nötig
+        await self._button_task()
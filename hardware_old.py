@@ -1,17 +1,30 @@
 import machine
 import uasyncio as asyncio
+import utime
 import state_manager
 
 # Pin-Definitionen
 LED_ALERT_PIN = 2
 BUTTON_ACCEPT_PIN = 15
 BUTTON_REJECT_PIN = 14
+DEBOUNCE_MS = 300  # Entprellzeit pro Button
+LED_REFRESH_S = 0.2  # Intervall für die LED-Aktualisierung
 
 # Globale Hardware-Objekte
 led_alert = None
 button_accept = None
 button_reject = None
 
+# Vom Interrupt gesetzt: (pin_id, ticks_ms) des letzten Tastendrucks
+_latest = None
+_flag = asyncio.ThreadSafeFlag()
+
+def _irq(pin_id):
+    """IRQ-Handler: merkt sich Button und Zeitpunkt und weckt button_task()."""
+    global _latest
+    _latest = (pin_id, utime.ticks_ms())
+    _flag.set()
+
 def init_hardware():
     """Initialisiert LED und Buttons."""
     global led_alert, button_accept, button_reject
@@ -20,28 +33,35 @@ def init_hardware():
     button_accept = machine.Pin(BUTTON_ACCEPT_PIN, machine.Pin.IN, machine.Pin.PULL_DOWN)
     button_reject = machine.Pin(BUTTON_REJECT_PIN, machine.Pin.IN, machine.Pin.PULL_DOWN)
 
-async def button_task():
-    """Überwacht die Buttons und ändert den Nachrichtenstatus."""
-    global led_alert, button_accept, button_reject
+    # Gedrückt = steigende Flanke (Pull-Down)
+    button_accept.irq(trigger=machine.Pin.IRQ_RISING, handler=lambda p: _irq(BUTTON_ACCEPT_PIN))
+    button_reject.irq(trigger=machine.Pin.IRQ_RISING, handler=lambda p: _irq(BUTTON_REJECT_PIN))
 
+async def _led_task():
+    """LED zeigt an, ob eine wartende Nachricht existiert."""
     while True:
-        # LED zeigt an, ob eine wartende Nachricht existiert
         msg = await state_manager.get_message()
-        if msg:
-            led_alert.value(1)
-        else:
-            led_alert.value(0)
+        led_alert.value(1 if msg else 0)
+        await asyncio.sleep(LED_REFRESH_S)
+
+async def button_task():
+    """Wartet auf Button-Interrupts und ändert den Nachrichtenstatus."""
+    asyncio.create_task(_led_task())
+    last_press = {BUTTON_ACCEPT_PIN: utime.ticks_add(utime.ticks_ms(), -DEBOUNCE_MS),
+                  BUTTON_REJECT_PIN: utime.ticks_add(utime.ticks_ms(), -DEBOUNCE_MS)}
 
-        # Accept gedrückt?
-        if button_accept.value() == 1:
+    while True:
+        await _flag.wait()  # Kein Polling: schläft bis zum nächsten Interrupt
+        pin_id, ts = _latest
+
+        # Entprellen: Flanken innerhalb von DEBOUNCE_MS ignorieren
+        if utime.ticks_diff(ts, last_press[pin_id]) <= DEBOUNCE_MS:
+            continue
+        last_press[pin_id] = ts
+
+        if pin_id == BUTTON_ACCEPT_PIN:
             print("✅ Button ACCEPT gedrückt – Nachricht wird akzeptiert.")
             await state_manager.accept_last_message()
-            await asyncio.sleep(0.3)  # Entprellen
-
-        # Reject gedrückt?
-        if button_reject.value() == 1:
+        else:
             print("❌ Button REJECT gedrückt – Nachricht wird abgelehnt.")
             await state_manager.reject_last_message()
-            await asyncio.sleep(0.3)  # Entprellen
-
-        await asyncio.sleep(0.05)  # Polling-Intervall
\ No newline at end of file
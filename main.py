@@ -17,6 +17,9 @@ import time_sync
 from webserver import Webserver
 
 async def main():
+    # WLAN-Verbindung parallel zur Initialisierung aufbauen
+    task_wifi = asyncio.create_task(connect_wifi.connect_wifi())
+
     event_queue = AsyncQueue()
     display_event_queue = AsyncQueue()
     
@@ -26,15 +29,24 @@ async def main():
     display_manager = DisplayManager(display_event_queue)
 
     # Start Coroutine
-    task_syc_time = asyncio.create_task(time_sync.sync_time())
     task_controll_hardware = asyncio.create_task(hardware.run())
     task_manage_state = asyncio.create_task(state_manager.run())
-    task_webserver = asyncio.create_task(webserver.run())
 
-    
-    # NEU: Der DisplayManager braucht einen Dummy-Task auf Core 0 (die run()-Funktion)
-    # um die Task-Struktur zu vervollständigen, obwohl die Arbeit auf Core 1 läuft.
+    # Der DisplayManager liest auf Core 0 die Display-Events, gerendert wird auf Core 1.
     task_display_manager = asyncio.create_task(display_manager.run())
+
+    # Startanzeige sofort, damit das Display nicht für die Dauer des
+    # WLAN-Verbindungsaufbaus schwarz bleibt
+    # (über den StateManager, damit er weiß, was angezeigt wird)
+    state_manager.show_boot_text("Starte...")
+
+    # Zeit-Sync und Webserver benötigen das WLAN. Bis dahin laufen die
+    # obigen Tasks bereits, die Verbindungszeit wird also überbrückt.
+    ip = await task_wifi
+    state_manager.clear_boot_text() # Startanzeige entfernen, falls keine Nachricht angezeigt wird
+    if ip:
+        task_syc_time = asyncio.create_task(time_sync.sync_time())
+    task_webserver = asyncio.create_task(webserver.run())
     
     await event_queue.put({"type": "NEWTEXT", "value": "Test-Event"})
     # Program end
@@ -45,7 +57,7 @@ async def main():
             task_controll_hardware, 
             task_manage_state,
             task_webserver, # Hinzugefügt: Webserver muss dauerhaft laufen!
-            task_display_manager # Hinzugefügt: Display-Dummy-Task zur Sicherheit
+            task_display_manager # Verarbeitet die Display-Events
         )
     except Exception as e:
         print(f"\nError during asyncio.gather: {e}")
@@ -55,9 +67,10 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        connect_wifi.connect_wifi()
-
-        asyncio.run(main())
+        # Event-Loop explizit holen: Die fast_io-Variante von uasyncio nutzt die
+        # Queue-Längen, Standard-uasyncio (V3) ignoriert sie und verhält sich wie asyncio.run().
+        loop = asyncio.get_event_loop(runq_len=16, waitq_len=16)
+        loop.run_until_complete(main())
     except KeyboardInterrupt:
         print("\nProgram end by User (KeyboardInterrupt).")
     except Exception as e:
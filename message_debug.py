@@ -1,5 +1,29 @@
-import os
 import time
+from utils import file_exists, format_timestamp
+
+def _tail_lines(path, count, block=512):
+    """
+    Liest nur die letzten `count` Zeilen einer Datei: Ab dem Dateiende wird
+    ein wachsender Block gelesen, bis er genug Zeilenumbrüche enthält.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        size = f.tell()
+        while True:
+            block = min(block, size)
+            f.seek(size - block)
+            lines = f.read(block).split(b'\n')
+            if lines and not lines[-1]:
+                lines.pop() # Umbruch am Dateiende
+            # Die erste Zeile ist unvollständig, solange nicht die ganze Datei gelesen wurde
+            if block == size:
+                break
+            if len(lines) > count:
+                lines = lines[1:]
+                break
+            block *= 2
+    return [line.decode() for line in lines[-count:]]
+
 
 class MessageDebug:
     def __init__(self, message_file='messages.txt', max_messages=5):
@@ -8,44 +32,41 @@ class MessageDebug:
         self.messages = []
 
     def _current_timestamp(self):
-        t = time.localtime()
-        return f"{t[2]:02d}.{t[1]:02d}.{t[0]} {t[3]:02d}:{t[4]:02d}"
+        return time.time()
 
     def load_messages(self):
         self.messages = []
-        if self.message_file in os.listdir('/'):
+        if file_exists(self.message_file):
             try:
-                with open(self.message_file, 'r') as f:
-                    lines = f.readlines()
-                    for line in lines[-self.max_messages:]:
-                        line = line.strip()
-                        if not line:
-                            continue
+                for line in _tail_lines(self.message_file, self.max_messages):
+                    line = line.strip()
+                    if not line:
+                        continue
 
-                        parts = line.split('|', 3)
-                        if len(parts) == 4:
-                            t, state, ts, txt = parts
-                            self.messages.append({
-                                "type": t,
-                                "state": state,
-                                "timestamp": ts,
-                                "text": txt
-                            })
-                        elif len(parts) == 2:
-                            t, txt = parts
-                            self.messages.append({
-                                "type": t,
-                                "state": "wait",
-                                "timestamp": self._current_timestamp(),
-                                "text": txt
-                            })
-                        else:
-                            self.messages.append({
-                                "type": "pickup",
-                                "state": "wait",
-                                "timestamp": self._current_timestamp(),
-                                "text": line
-                            })
+                    parts = line.split('|', 3)
+                    if len(parts) == 4:
+                        t, state, ts, txt = parts
+                        self.messages.append({
+                            "type": t,
+                            "state": state,
+                            "timestamp": ts,
+                            "text": txt
+                        })
+                    elif len(parts) == 2:
+                        t, txt = parts
+                        self.messages.append({
+                            "type": t,
+                            "state": "wait",
+                            "timestamp": self._current_timestamp(),
+                            "text": txt
+                        })
+                    else:
+                        self.messages.append({
+                            "type": "pickup",
+                            "state": "wait",
+                            "timestamp": self._current_timestamp(),
+                            "text": line
+                        })
             except Exception as e:
                 print("❌ Fehler beim Laden der Nachrichten:", e)
         else:
@@ -58,7 +79,7 @@ class MessageDebug:
 
         print("---- Aktuelle Nachrichten ----")
         for idx, m in enumerate(self.messages):
-            print(f"[{idx}] Typ: {m['type']}, State: {m['state']}, Zeit: {m['timestamp']}")
+            print(f"[{idx}] Typ: {m['type']}, State: {m['state']}, Zeit: {format_timestamp(m['timestamp'])}")
             print(f"     Text: {m['text']}")
         print("-----------------------------")
 
@@ -0,0 +1,110 @@
+// modscale.c
+//
+// Native MicroPython module (.mpy) with the framebuffer scaling used by
+// display_manager.py. It does the same work as DisplayManager.scale_framebuf_into,
+// but without the bytecode interpreter in the per-column loop.
+//
+// Build: see the Makefile in this directory, then copy modscale.mpy to the device.
+//
+// Author: Simon Klenk 2025
+// License: MIT - See the LICENSE file in the project directory for the full license text.
+
+#include "py/dynruntime.h"
+
+// scale_framebuf(buf_dest, buf_source, width_dest, height_dest, width_source, height_source)
+//
+// buf_source: MONO_VLSB, height_source must be 8 -> one byte per column.
+// buf_dest:   MONO_VLSB, width_dest * ceil(height_dest / 8) bytes, stride width_dest.
+// Vertical: destination row r takes source bit r * 8 / height_dest (as in Python).
+// Horizontal: nearest neighbour, rounded like int(x * ratio + 0.5) in Python.
+static mp_obj_t scale_framebuf(size_t n_args, const mp_obj_t *args) {
+    mp_buffer_info_t dest, source;
+    mp_get_buffer_raise(args[0], &dest, MP_BUFFER_WRITE);
+    mp_get_buffer_raise(args[1], &source, MP_BUFFER_READ);
+    mp_int_t width_dest = mp_obj_get_int(args[2]);
+    mp_int_t height_dest = mp_obj_get_int(args[3]);
+    mp_int_t width_source = mp_obj_get_int(args[4]);
+    mp_int_t height_source = mp_obj_get_int(args[5]);
+
+    if (height_source != 8 || width_source <= 0 || width_dest <= 0
+        || height_dest <= 0 || height_dest > 64) {
+        mp_raise_ValueError(MP_ERROR_TEXT("invalid dimensions"));
+    }
+    mp_int_t pages = (height_dest + 7) >> 3;
+    if ((mp_int_t)dest.len < width_dest * pages || (mp_int_t)source.len < width_source) {
+        mp_raise_ValueError(MP_ERROR_TEXT("buffer too small"));
+    }
+
+    // Destination row r shows source bit r * 8 / height_dest, the same mapping as
+    // DisplayManager._build_column_table (also for heights that are not a multiple of 8).
+    // Columns are at most 64 rows, kept as two 32-bit halves (pages 0-3 and 4-7):
+    // Cortex-M0+ has no 64-bit shifts or hardware divide, and both would pull in
+    // libgcc helpers (__aeabi_llsl, __aeabi_idiv). The quotient is stepped instead:
+    // acc = r * 8 - y * height_dest stays below height_dest.
+    uint32_t masks_lo[8] = {0}, masks_hi[8] = {0};
+    mp_int_t acc = 0;
+    int y = 0;
+    for (mp_int_t r = 0; r < height_dest; r++) {
+        while (acc >= height_dest) {
+            acc -= height_dest;
+            y++;
+        }
+        if (r < 32) {
+            masks_lo[y] |= (uint32_t)1 << r;
+        } else {
+            masks_hi[y] |= (uint32_t)1 << (r - 32);
+        }
+        acc += 8;
+    }
+
+    const uint8_t *src = source.buf;
+    uint8_t *dst = dest.buf;
+    mp_int_t last_source = width_source - 1;
+    int prev_byte = -1;
+    uint32_t column_lo = 0, column_hi = 0;
+
+    // sx = (2 * x * width_source + width_dest) / (2 * width_dest), computed
+    // incrementally: num is the remainder, it grows by 2 * width_source per column.
+    mp_int_t step = width_source << 1;
+    mp_int_t denom = width_dest << 1;
+    mp_int_t num = width_dest;
+    mp_int_t sx = 0;
+
+    for (mp_int_t x = 0; x < width_dest; x++) {
+        while (num >= denom) {
+            num -= denom;
+            sx++;
+        }
+        num += step;
+        int src_byte = src[sx > last_source ? last_source : sx];
+        // Neighbouring columns often repeat (horizontal stretch), reuse the expansion
+        if (src_byte != prev_byte) {
+            column_lo = 0;
+            column_hi = 0;
+            for (int y = 0; y < 8; y++) {
+                if (src_byte & (1 << y)) {
+                    column_lo |= masks_lo[y];
+                    column_hi |= masks_hi[y];
+                }
+            }
+            prev_byte = src_byte;
+        }
+        // Write the column into the pages of the destination (stride = width_dest)
+        uint8_t *out = dst + x;
+        for (mp_int_t p = 0; p < pages; p++) {
+            uint32_t word = p < 4 ? column_lo : column_hi;
+            *out = (uint8_t)(word >> ((p & 3) << 3));
+            out += width_dest;
+        }
+    }
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(scale_framebuf_obj, 6, 6, scale_framebuf);
+
+mp_obj_t mpy_init(mp_obj_fun_bc_t *self, size_t n_args, size_t n_kw, mp_obj_t *args) {
+    MP_DYNRUNTIME_INIT_ENTRY
+
+    mp_store_global(MP_QSTR_scale_framebuf, MP_OBJ_FROM_PTR(&scale_framebuf_obj));
+
+    MP_DYNRUNTIME_INIT_EXIT
+}
@@ -112,6 +112,12 @@ class SH1106(framebuf.FrameBuffer):
             super().__init__(self.renderbuf, self.width, self.height,
                              framebuf.MONO_VLSB)
 
+        # Memoryviews of each page in the display buffer, created once so that
+        # show() doesn't copy a new bytes object per page on every update.
+        mv = memoryview(self.displaybuf)
+        self.page_views = [mv[self.width * page:self.width * page + self.width]
+                           for page in range(self.pages)]
+
         # flip() was called rotate() once, provide backwards compatibility.
         self.rotate = self.flip
         self.init_display()
@@ -155,8 +161,8 @@ class SH1106(framebuf.FrameBuffer):
 
     def show(self, full_update = False):
         # self.* lookups in loops take significant time (~4fps).
-        (w, p, db, rb) = (self.width, self.pages,
-                          self.displaybuf, self.renderbuf)
+        (w, p, db, rb, pv) = (self.width, self.pages,
+                              self.displaybuf, self.renderbuf, self.page_views)
         if self.rotate90:
             for i in range(self.bufsize):
                 db[w * (i % p) + (i // p)] = rb[i]
@@ -170,7 +176,7 @@ class SH1106(framebuf.FrameBuffer):
                 self.write_cmd(_SET_PAGE_ADDRESS | page)
                 self.write_cmd(_LOW_COLUMN_ADDRESS | 2)
                 self.write_cmd(_HIGH_COLUMN_ADDRESS | 0)
-                self.write_data(db[(w*page):(w*page+w)])
+                self.write_data(pv[page])
         self.pages_to_update = 0
 
     def pixel(self, x, y, color=None):
@@ -247,6 +253,8 @@ class SH1106_I2C(SH1106):
         self.addr = addr
         self.res = res
         self.temp = bytearray(2)
+        # Control byte + data buffer for writevto(); reused for every write.
+        self.data_vec = [b'\x40', None]
         self.delay = delay
         if res is not None:
             res.init(res.OUT, value=1)
@@ -258,7 +266,11 @@ class SH1106_I2C(SH1106):
         self.i2c.writeto(self.addr, self.temp)
 
     def write_data(self, buf):
-        self.i2c.writeto(self.addr, b'\x40'+buf)
+        # Send the control byte and buf in one transfer without concatenating.
+        vec = self.data_vec
+        vec[1] = buf
+        self.i2c.writevto(self.addr, vec)
+        vec[1] = None
 
     def reset(self):
         super().reset(self.res)
@@ -1,12 +1,58 @@
 # state_manager.py
 import uasyncio as asyncio
-from machine import RTC
 import ujson
 import os
+import time
+from micropython import const
+from utils import file_exists, format_timestamp
+
+# Debug-Ausgaben pro Ereignis; print() blockiert auf der UART ca. 1 ms pro Zeile.
+# Als const(0) entfernt der Compiler die "if _DEBUG:"-Blöcke vollständig.
+_DEBUG = const(0)
 
 _max_messages = 5
 _message_file = 'messages.txt'
-_messages = []  # [{"type": "...", "value": "...", "state": "...", "timestamp": ...}]
+# Nachrichten als parallele Listen (ein Slot pro Nachricht) statt einer Liste
+# von Dicts: spart RAM pro Nachricht und Hash-Lookups. Die Listen sind ein
+# Ringpuffer fester Größe: _head ist der Slot der ältesten Nachricht, _count
+# die Anzahl belegter Slots. Anhängen überschreibt bei vollem Puffer die
+# älteste Nachricht, ohne Listen zu verschieben oder neu anzulegen.
+_types = [None] * _max_messages
+_values = [None] * _max_messages
+_states = [None] * _max_messages
+_timestamps = [None] * _max_messages
+# Serialisierte JSON-Form jeder Nachricht (bytes); None = muss neu gebaut werden
+_entry_json = [None] * _max_messages
+_head = 0
+_count = 0
+
+# messages.txt ist ein Append-only-Journal, eine JSON-Zeile pro Änderung:
+#   [type, value, state, timestamp]  neue Nachricht
+#   {"patch": n, "state": ...}  Status der n-ten Nachricht im Journal ändern
+# Übersteigt die Zeilenzahl _compact_lines, wird es mit den Nachrichten neu geschrieben.
+_compact_lines = 4 * _max_messages
+
+# Event-Typ -> Name der Handler-Methode; in __init__ einmalig
+# zu gebundenen Methoden aufgelöst, damit run() nur ein Dict-Lookup pro Event macht
+_EVENT_HANDLERS = {
+    "BUTTON_PRESSED": "_handle_button",
+    "PICKUP": "_handle_pickup",
+    "EMERGENCY_CB": "_handle_emergency_cb",
+    "EMERGENCY_EVENT": "_handle_emergency_event",
+}
+# Taste -> neuer Status der angezeigten Nachricht
+_BUTTON_STATES = {"ACCEPT": "accepted", "REJECT": "rejected"}
+
+# Feste Texte und Events einmalig anlegen statt pro Ereignis
+# (das Display liest Events nur, das DELETETEXT-Dict kann daher geteilt werden)
+_MSG_STAFF = "Staffler bitte zum Kids-Check-In kommen"
+_MSG_MEDIC = "Sanitäterteam bitte zum Kids-Check-In kommen"
+_DELETETEXT_EVENT = {"type": "DELETETEXT", "value": ""}
+
+
+def _slots():
+    """Slots der gespeicherten Nachrichten, älteste zuerst."""
+    return [(_head + i) % _max_messages for i in range(_count)]
 
 
 class StateManager:
@@ -16,57 +62,229 @@ class StateManager:
         self._display_event_queue = display_event_queue
         self._current_state = "INITIAL"
         
-        # Index der aktuell auf dem Display angezeigten Nachricht (-1 = keine)
+        # Slot der aktuell auf dem Display angezeigten Nachricht (-1 = keine)
         self._current_display_message_index = -1
         
         # Event zum asynchronen Schreiben
         self._messages_dirty = asyncio.Event()
-
-        # RTC-Objekt cachen
-        self.rtc = RTC()
+        # Noch nicht geschriebene Journal-Zeilen und Zähler des Journals
+        self._pending_lines = []
+        # Noch nicht geschriebene Statusänderungen: Journal-Position -> neuer Status.
+        # Mehrere Änderungen derselben Nachricht ergeben so nur eine Patch-Zeile.
+        self._pending_patches = {}
+        self._log_entries = 0 # Nachrichten-Zeilen im Journal
+        self._log_lines = 0   # Alle Zeilen im Journal (inkl. Patches)
+        # Serialisierte /messages-Antwort; None = muss neu gebaut werden
+        self._messages_json_cache = None
+        # Version der Nachrichten für das ETag von /messages; der Startwert ist
+        # zufällig, damit sich ETags nach einem Neustart nicht wiederholen
+        self._messages_version = int.from_bytes(os.urandom(2), 'big') << 16
+        # Zuletzt angeforderter Display-Zustand; ältere, noch nicht gesendete
+        # Anforderungen werden überschrieben (nur der neueste Text zählt)
+        self._pending_display = None
+        self._display_ready = asyncio.Event()
+        self._dispatch = {t: getattr(self, name) for t, name in _EVENT_HANDLERS.items()}
 
         # Datei prüfen und laden/erstellen
+        self._log_fh = None # Dauerhaft geöffnetes Journal (Modus "a")
         self._ensure_message_file()
         self._load_messages_from_file()
+        self._open_log()
 
     def _current_timestamp(self):
-        t = self.rtc.datetime()  # (year, month, day, weekday, hour, min, sec, ms)
-        return f"{t[2]:02d}.{t[1]:02d}.{t[0]} {t[4]:02d}:{t[5]:02d}"
+        # Sekunden seit Epoche (RTC, lokale Zeit); formatiert wird erst in format_timestamp
+        return time.time()
 
     # ---------------- File Management ----------------
 
     def _ensure_message_file(self):
-        if _message_file not in os.listdir():
+        if not file_exists(_message_file):
             with open(_message_file, "w") as f:
-                f.write("[]")
+                pass
             print("[StateManager] messages.txt angelegt.")
 
     def _load_messages_from_file(self):
-        global _messages
+        global _head, _count
+        entries = []
+        lines = 0
+        # Altformat, defekte oder übersprungene Zeilen: Datei danach neu schreiben,
+        # damit das Journal wieder nur aus gültigen, mit "\n" abgeschlossenen Zeilen besteht
+        rewrite = False
         try:
             with open(_message_file, "r") as f:
-                data = f.read().strip()
-                _messages = ujson.loads(data) if data else []
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    lines += 1
+                    # Jede Zeile einzeln: eine abgerissene Zeile (z.B. Stromausfall beim
+                    # Anhängen) verwirft nur sich selbst, nicht alle folgenden Einträge
+                    try:
+                        record = ujson.loads(line)
+                        if isinstance(record, dict):
+                            if "patch" in record:
+                                index = record["patch"]
+                                if 0 <= index < len(entries):
+                                    entries[index][2] = record["state"]
+                            else:
+                                # Ältere Journal-Zeile: Nachricht als Dict
+                                entries.append(self._entry_from_dict(record))
+                        elif not isinstance(record, list):
+                            rewrite = True # Unbekannter Datensatz
+                        elif not record or isinstance(record[0], dict):
+                            # Altes Format: komplette Liste von Dicts als JSON-Array (auch "[]")
+                            rewrite = True
+                            for m in record:
+                                if isinstance(m, dict):
+                                    entries.append(self._entry_from_dict(m))
+                        elif len(record) == 4:
+                            entries.append(record)
+                        else:
+                            rewrite = True # Datensatz mit falscher Feldzahl überspringen
+                    except (ValueError, TypeError, KeyError, IndexError) as e:
+                        print(f"[StateManager] Ungültige Zeile {lines} in messages.txt übersprungen: {e}")
+                        rewrite = True
         except Exception as e:
             print("[StateManager] Fehler beim Lesen von messages.txt:", e)
-            _messages = []
-        print(f"[StateManager] {_message_file} geladen. Aktuelle Einträge: {len(_messages)}")
+        _head = 0
+        _count = 0
+        for slot, (t, v, st, ts) in enumerate(entries[-_max_messages:]):
+            _types[slot] = t
+            _values[slot] = v
+            _states[slot] = st
+            _timestamps[slot] = ts
+            _entry_json[slot] = None
+            _count += 1
+        self._log_entries = len(entries)
+        self._log_lines = lines
+        print(f"[StateManager] {_message_file} geladen. Aktuelle Einträge: {_count}")
+        self._compact_if_needed(force=rewrite)
+
+    def _entry_from_dict(self, m):
+        return [m.get("type"), m.get("value"), m.get("state"), m.get("timestamp")]
+
+    def _journal(self, record):
+        """Merkt eine Journal-Zeile vor; geschrieben wird im _file_writer_task."""
+        self._pending_lines.append(ujson.dumps(record))
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        """Nachrichten geändert: Schreibvorgang anstoßen und JSON-Cache verwerfen."""
+        self._messages_json_cache = None
+        self._messages_version += 1
+        self._messages_dirty.set()
+
+    def _append_message(self, msg_type, value, state, timestamp):
+        """
+        Speichert eine Nachricht im Ringpuffer (bei vollem Puffer wird die
+        älteste überschrieben), journalisiert sie und gibt ihren Slot zurück.
+        """
+        global _head, _count
+        slot = (_head + _count) % _max_messages
+        if _count == _max_messages:
+            _head = (_head + 1) % _max_messages
+        else:
+            _count += 1
+        _types[slot] = msg_type
+        _values[slot] = value
+        _states[slot] = state
+        _timestamps[slot] = timestamp
+        _entry_json[slot] = None
+        self._log_entries += 1
+        self._journal((msg_type, value, state, timestamp))
+        return slot
+
+    def _open_log(self):
+        try:
+            self._log_fh = open(_message_file, "a")
+        except OSError as e:
+            self._log_fh = None
+            print("[StateManager] Fehler beim Öffnen von messages.txt:", e)
+
+    def close(self):
+        """Schließt das Journal (z.B. beim Beenden)."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
 
     def _write_messages_to_file(self):
-        global _messages
-        temp_messages = list(_messages)
-        while len(temp_messages) > _max_messages:
-            temp_messages.pop(0)
-        _messages = temp_messages
+        """Hängt die vorgemerkten Zeilen in einem Schreibvorgang an das Journal an."""
+        lines = self._pending_lines
+        patches = self._pending_patches
+        if not lines and not patches:
+            return
+        self._pending_lines = []
+        self._pending_patches = {}
+        # Patches nach den Nachrichten-Zeilen, damit ihre Ziel-Nachricht schon im Journal steht
+        for index, state in patches.items():
+            lines.append(ujson.dumps({"patch": index, "state": state}))
         try:
-            with open(_message_file, "w") as f:
-                f.write(ujson.dumps(temp_messages))
-            print(f"[StateManager] {len(temp_messages)} Nachrichten gespeichert.")
+            if self._log_fh is None:
+                self._open_log()
+            f = self._log_fh
+            for line in lines:
+                f.write(line)
+                f.write("\n")
+            f.flush()
+            self._log_lines += len(lines)
+            if _DEBUG:
+                print(f"[StateManager] {len(lines)} Journal-Zeilen gespeichert.")
         except Exception as e:
             print("[StateManager] Fehler beim Schreiben in messages.txt:", e)
+        self._compact_if_needed()
+
+    def _compact_if_needed(self, force=False):
+        """Schreibt das Journal nur mit den aktuellen Nachrichten neu, wenn es zu lang wird (oder force)."""
+        if not force and self._log_lines <= _compact_lines:
+            return
+        reopen = self._log_fh is not None
+        self.close()
+        try:
+            with open(_message_file, "w") as f:
+                for slot in _slots():
+                    f.write(ujson.dumps((_types[slot], _values[slot], _states[slot], _timestamps[slot])))
+                    f.write("\n")
+            self._log_entries = _count
+            self._log_lines = _count
+            print(f"[StateManager] messages.txt kompaktiert ({_count} Nachrichten).")
+        except Exception as e:
+            print("[StateManager] Fehler beim Kompaktieren von messages.txt:", e)
+        if reopen:
+            self._open_log()
 
     def get_all_messages(self):
-        return list(_messages)
+        """Baut die Dict-Form der Nachrichten nur für die API (JSON-Antwort)."""
+        return [
+            {"type": _types[slot], "value": _values[slot], "state": _states[slot],
+             "timestamp": format_timestamp(_timestamps[slot])}
+            for slot in _slots()
+        ]
+
+    def _entry_to_bytes(self, slot):
+        """JSON einer Nachricht; wird pro Slot gecacht und nur nach Änderung neu erzeugt."""
+        data = _entry_json[slot]
+        if data is None:
+            data = ujson.dumps({
+                "type": _types[slot], "value": _values[slot], "state": _states[slot],
+                "timestamp": format_timestamp(_timestamps[slot]),
+            }).encode()
+            _entry_json[slot] = data
+        return data
+
+    def get_messages_json(self):
+        """
+        JSON-Antwort für /messages als bytes. Wird nur nach einer Änderung
+        neu zusammengesetzt, dabei werden nur geänderte Nachrichten neu serialisiert.
+        """
+        if self._messages_json_cache is None:
+            self._messages_json_cache = (
+                b'{"messages": [' + b', '.join(self._entry_to_bytes(slot) for slot in _slots()) + b']}'
+            )
+        return self._messages_json_cache
+
+    def get_messages_etag(self):
+        """ETag der aktuellen /messages-Antwort; ändert sich mit jeder Änderung der Nachrichten."""
+        return 'W/"%x"' % self._messages_version
 
     # ---------------- Async File Writer ----------------
 
@@ -74,111 +292,129 @@ class StateManager:
         while True:
             await self._messages_dirty.wait()
             self._messages_dirty.clear()
-            await asyncio.sleep_ms(500)
-            print("[StateManager] Änderungen erkannt, starte Schreibvorgang...")
+            # Schreiben, sobald 100 ms lang keine Änderung mehr kam; weitere
+            # Änderungen verlängern das Fenster, höchstens aber auf 500 ms
+            for _ in range(5):
+                await asyncio.sleep_ms(100)
+                if not self._messages_dirty.is_set():
+                    break
+                self._messages_dirty.clear()
+            if _DEBUG:
+                print("[StateManager] Änderungen erkannt, starte Schreibvorgang...")
             self._write_messages_to_file()
 
+    # ---------------- Display Writer ----------------
+
+    def _set_display(self, payload):
+        """Merkt den neuen Display-Zustand vor; gesendet wird im _display_writer_task."""
+        self._pending_display = payload
+        self._display_ready.set()
+
+    async def _display_writer_task(self):
+        while True:
+            await self._display_ready.wait()
+            self._display_ready.clear()
+            payload = self._pending_display
+            self._pending_display = None
+            if payload:
+                await self._display_event_queue.put(payload)
+
+    # ---------------- Startanzeige ----------------
+
+    def show_boot_text(self, text):
+        """Zeigt einen Text während des Starts (z.B. solange das WLAN verbindet)."""
+        self._set_display({"type": "NEWTEXT", "value": text})
+
+    def clear_boot_text(self):
+        """
+        Entfernt die Startanzeige - aber nur, wenn inzwischen keine Nachricht
+        angezeigt wird; eine während des Starts eingegangene Nachricht bleibt stehen.
+        """
+        if self._current_display_message_index == -1:
+            self._set_display(_DELETETEXT_EVENT)
+
     # ---------------- Event Loop ----------------
 
     async def run(self):
         asyncio.create_task(self._file_writer_task())
+        asyncio.create_task(self._display_writer_task())
         while True:
             event = await self._event_queue.get()
-            print(f"[StateManager] Empfing Ereignis: '{event}'")
+            if _DEBUG:
+                print(f"[StateManager] Empfing Ereignis: '{event}'")
 
             event_type = event.get("type", "UNKNOWN_TYPE")
             event_value = event.get("value", "UNKNOWN_VALUE")
 
-            if event_type == "BUTTON_PRESSED":
-                if event_value == "ACCEPT":
-                    await self._handle_accept()
-                elif event_value == "REJECT":
-                    await self._handle_reject()
-
-            elif event_type == "PICKUP":
-                await self._handle_pickup(event_value)
-
-            elif event_type == "EMERGENCY_CB":
-                await self._handle_emergency_cb()
-
-            elif event_type == "EMERGENCY_EVENT":
-                await self._handle_emergency_event()
+            handler = self._dispatch.get(event_type)
+            if handler:
+                await handler(event_value)
 
     # ---------------- State Update ----------------
 
     def update_state(self, index, new_state):
-        print(f"[StateManager] update_state aufgerufen für index {index}, neuer state: {self._current_display_message_index}")
-        _messages[self._current_display_message_index - 1]["state"] = new_state
-        self._messages_dirty.set()
-        print(f"[StateManager] update_state aufgerufen für index {index}, neuer state: {self._current_display_message_index}")
+        if _DEBUG:
+            print(f"[StateManager] update_state aufgerufen für index {index}, neuer state: {new_state}")
+        if _states[index] == new_state:
+            return # Keine Änderung, nichts zu schreiben
+        _states[index] = new_state
+        _entry_json[index] = None
+        # Position der Nachricht im Journal: der Puffer enthält dessen letzte Einträge
+        age = (index - _head) % _max_messages # 0 = älteste gespeicherte Nachricht
+        self._pending_patches[self._log_entries - _count + age] = new_state
+        self._mark_dirty()
 
     # ---------------- Event Handlers ----------------
 
-    async def _handle_accept(self):
-        print("[StateManager] Verarbeite 'ACCEPT'")
-        if self._current_display_message_index != -1:
-            display_index = self._current_display_message_index
-            self.update_state(display_index, "accepted")
-            await self._display_event_queue.put({"type": "DELETETEXT", "value": ""})
-            self._current_display_message_index = -1
-        else:
-            print("[StateManager] ACCEPT ignoriert: Kein aktiver Nachrichtentext.")
-
-    async def _handle_reject(self):
-        print("[StateManager] Verarbeite 'REJECT'")
-        if self._current_display_message_index != -1:
-            display_index = self._current_display_message_index
-            self.update_state(display_index, "rejected")
-            await self._display_event_queue.put({"type": "DELETETEXT", "value": ""})
-            self._current_display_message_index = -1
-        else:
-            print("[StateManager] REJECT ignoriert: Kein aktiver Nachrichtentext.")
+    async def _handle_button(self, button):
+        new_state = _BUTTON_STATES.get(button)
+        if new_state:
+            await self._resolve_current(button, new_state)
+
+    async def _resolve_current(self, button, new_state):
+        """Setzt den Status der angezeigten Nachricht (ACCEPT/REJECT) und leert das Display."""
+        if _DEBUG:
+            print(f"[StateManager] Verarbeite '{button}'")
+        display_index = self._current_display_message_index
+        if display_index == -1:
+            if _DEBUG:
+                print(f"[StateManager] {button} ignoriert: Kein aktiver Nachrichtentext.")
+            return
+        self.update_state(display_index, new_state)
+        self._set_display(_DELETETEXT_EVENT)
+        self._current_display_message_index = -1
 
     async def _handle_pickup(self, pickup_value):
-        print(f"[StateManager] Verarbeite 'PICKUP' mit Wert {pickup_value}")
-        entry = {
-            "type": "PICKUP",
-            "value": pickup_value,
-            "state": "wait",
-            "timestamp": self._current_timestamp()
-        }
-        _messages.append(entry)
-        self._current_display_message_index = len(_messages) - 1
-        self._messages_dirty.set()
-        await self._display_event_queue.put({
+        if _DEBUG:
+            print(f"[StateManager] Verarbeite 'PICKUP' mit Wert {pickup_value}")
+        self._current_display_message_index = self._append_message(
+            "PICKUP", pickup_value, "wait", self._current_timestamp()
+        )
+        self._set_display({
             "type": "NEWTEXT",
             "value": f"Kind abholen: {pickup_value}"
         })
 
-    async def _handle_emergency_cb(self):
-        print(f"[StateManager] Verarbeite 'EMERGENCY_CB'")
-        entry = {
-            "type": "EMERGENCY_CB",
-            "value": "Staffler bitte zum Kids-Check-In kommen",
-            "state": "wait",
-            "timestamp": self._current_timestamp()
-        }
-        _messages.append(entry)
-        self._current_display_message_index = len(_messages) - 1
-        self._messages_dirty.set()
-        await self._display_event_queue.put({
+    async def _handle_emergency_cb(self, _value=None):
+        if _DEBUG:
+            print(f"[StateManager] Verarbeite 'EMERGENCY_CB'")
+        self._current_display_message_index = self._append_message(
+            "EMERGENCY_CB", _MSG_STAFF, "wait", self._current_timestamp()
+        )
+        self._set_display({
             "type": "NEWTEXT",
-            "value": "Staffler bitte zum Kids-Check-In kommen"
+            "value": _MSG_STAFF
         })
-        print(f"[StateManager] event eingetragen mit index {self._current_display_message_index}")
-
-    async def _handle_emergency_event(self):
-        print(f"[StateManager] Verarbeite 'EMERGENCY_EVENT'")
-        entry = {
-            "type": "EMERGENCY_EVENT",
-            "value": "Sanitäterteam bitte zum Kids-Check-In kommen",
-            "state": "wait",
-            "timestamp": self._current_timestamp()
-        }
-        _messages.append(entry)
-        self._current_display_message_index = len(_messages) - 1
-        self._messages_dirty.set()
-        await self._display_event_queue.put({
+        if _DEBUG:
+            print(f"[StateManager] event eingetragen mit index {self._current_display_message_index}")
+
+    async def _handle_emergency_event(self, _value=None):
+        if _DEBUG:
+            print(f"[StateManager] Verarbeite 'EMERGENCY_EVENT'")
+        self._current_display_message_index = self._append_message(
+            "EMERGENCY_EVENT", _MSG_MEDIC, "wait", self._current_timestamp()
+        )
+        self._set_display({
             "type": "NEWTEXT",
-            "value": "Sanitäterteam bitte zum Kids-Check-In kommen"
+            "value": _MSG_MEDIC
         })
\ No newline at end of file
@@ -1,6 +1,6 @@
 import uasyncio as asyncio
-import os
-from machine import RTC
+import time
+from utils import file_exists, format_timestamp
 
 _lock = asyncio.Lock()
 _max_messages = 5
@@ -22,7 +22,7 @@ def init_state():
     global _messages
     _messages = []
 
-    if _message_file in os.listdir('/'):
+    if file_exists(_message_file):
         try:
             with open(_message_file, 'r') as f:
                 lines = f.readlines()
@@ -62,9 +62,8 @@ def init_state():
 # Hilfsfunktion: Zeitstempel aus RTC
 # --------------------------
 def _current_timestamp():
-    rtc = RTC()
-    t = rtc.datetime()  # (year, month, day, weekday, hour, min, sec, ms)
-    return f"{t[2]:02d}.{t[1]:02d}.{t[0]} {t[4]:02d}:{t[5]:02d}"
+    # Sekunden seit Epoche (RTC, lokale Zeit); Text erst bei der Ausgabe
+    return time.time()
 
 # --------------------------
 # Nachricht speichern
@@ -84,7 +83,9 @@ async def set_message(msg):
         msg.setdefault("state", "wait")
 
         _messages.append(msg)
-        _messages = _messages[-_max_messages:]
+        # Nur bei Überlauf kürzen, statt die Liste bei jeder Nachricht neu zu kopieren
+        if len(_messages) > _max_messages:
+            del _messages[:-_max_messages]
         await _save_to_file()
 
     if _display_callback:
@@ -152,7 +153,12 @@ async def get_message():
 
 async def get_all_messages():
     async with _lock:
-        return list(_messages)
+        return [{
+            "type": m["type"],
+            "state": m["state"],
+            "timestamp": format_timestamp(m["timestamp"]),
+            "text": m["text"]
+        } for m in _messages]
 
 # --------------------------
 # Datei speichern
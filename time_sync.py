@@ -2,21 +2,24 @@ from machine import RTC
 import ntptime
 import time
 
+def _last_sundays(year):
+    """
+    Tag des letzten Sonntags im März und im Oktober (beide Monate haben 31 Tage).
+    Ein mktime/localtime pro Monat: Wochentag des 31. bestimmen und zurückrechnen.
+    """
+    days = []
+    for month in (3, 10):
+        weekday = time.localtime(time.mktime((year, month, 31, 0, 0, 0, 0, 0)))[6] # Montag = 0
+        days.append(31 - (weekday + 1) % 7)
+    return days[0], days[1]
+
 def is_sommerzeit(year, month, day, hour):
     """
     Prüft, ob ein Datum in Deutschland in der Sommerzeit liegt.
     Rückgabe: True = MESZ, False = MEZ
     """
-    # Letzter Sonntag im März
-    last_sunday_march = max(
-        d for d in range(25, 32)
-        if time.localtime(time.mktime((year, 3, d, 0, 0, 0, 0, 0)))[6] == 6
-    )
-    # Letzter Sonntag im Oktober
-    last_sunday_october = max(
-        d for d in range(25, 32)
-        if time.localtime(time.mktime((year, 10, d, 0, 0, 0, 0, 0)))[6] == 6
-    )
+    # Letzter Sonntag im März / im Oktober
+    last_sunday_march, last_sunday_october = _last_sundays(year)
 
     if (month > 3 and month < 10):
         return True
@@ -0,0 +1,26 @@
+# filename: utils.py
+# ----------------------------------------------------------------------
+# Kleine Hilfsfunktionen, die StateManager, state_manager_old und
+# MessageDebug gemeinsam nutzen.
+# ----------------------------------------------------------------------
+import os
+import time
+
+
+def file_exists(path):
+    """Prüft per os.stat, ob die Datei existiert (ohne das Verzeichnis zu listen)."""
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def format_timestamp(ts):
+    """Formatiert einen Zeitstempel (Sekunden seit Epoche oder bereits Text) als 'TT.MM.JJJJ HH:MM'."""
+    if isinstance(ts, str):
+        if not ts.isdigit():
+            return ts # Ältere Einträge speichern den Zeitstempel bereits als Text
+        ts = int(ts) # Zeilenformat von state_manager_old: Epoche als Text
+    t = time.localtime(ts)  # (year, month, day, hour, min, sec, weekday, yearday)
+    return "%02d.%02d.%d %02d:%02d" % (t[2], t[1], t[0], t[3], t[4])
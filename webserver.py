@@ -1,69 +1,140 @@
 import uasyncio as asyncio
-import network
-from microdot import Microdot, send_file, redirect, Response
+import os
+from microdot import Microdot, Response
+from connect_wifi import sta_if
 
 app = Microdot()
 Response.default_content_type = 'application/json'
 
+_PAGE_NAMES = ('pickup', 'status', 'emergency')
+_DEFAULT_PAGE = 'pickup'
+# Seitenpfade je base_dir, werden nur beim ersten Webserver für dieses Verzeichnis gebaut
+_PAGE_FILES_CACHE = {}
+# Die HTML-Seiten sind statisch (Daten kommen per /messages), Browser dürfen sie cachen;
+# danach wird per ETag nachgefragt und unverändert nur ein 304 ohne Body gesendet
+STATIC_MAX_AGE = 60
+_STATIC_CACHE_CONTROL = f'max-age={STATIC_MAX_AGE}, must-revalidate'
+# Notfallart aus dem Formular -> Event-Typ
+_EMERGENCY_MAP = {"staff": "EMERGENCY_CB", "medical": "EMERGENCY_EVENT"}
+# Antwort auf /submit ist immer dieselbe Weiterleitung: einmal anlegen und wiederverwenden
+# (Microdot setzt pro Request nur is_head und ergänzt gleichbleibende Header)
+_REDIRECT_STATUS = Response(status_code=302, reason='Found', headers={
+    'Location': '/?page=status',
+    'Content-Length': '0',
+})
+
 
 class Webserver:
     def __init__(self, event_queue, state_manager, base_dir="/"):
         self._base_dir = base_dir
         self._event_queue = event_queue
         self.page_files = self.create_page_files()
+        # HTML-Seiten einmalig in den RAM laden, statt sie pro Request aus dem Flash zu lesen
+        self.pages = self.load_pages()
         self.state_manager = state_manager
 
+        # Routen einmalig registrieren (nicht bei jedem Aufruf von run())
+        app.route('/')(self.index)
+        app.route('/submit', methods=['POST'])(self.handle_post)
+        app.route('/messages')(self.show_messages)
+
     def create_page_files(self):
-        return {
-            'pickup': f'{self._base_dir}/pickup.html',
-            'status': f'{self._base_dir}/status.html',
-            'emergency': f'{self._base_dir}/emergency.html'
-        }
+        page_files = _PAGE_FILES_CACHE.get(self._base_dir)
+        if page_files is None:
+            prefix = self._base_dir.rstrip('/') + '/'
+            page_files = {name: prefix + name + '.html' for name in _PAGE_NAMES}
+            _PAGE_FILES_CACHE[self._base_dir] = page_files
+        return page_files
+
+    def load_pages(self):
+        """Liest die Seiten ein: {name: (body, etag, headers)}, ETag aus Änderungszeit und Größe."""
+        pages = {}
+        for name, file in self.page_files.items():
+            try:
+                stat = os.stat(file)
+                with open(file, 'rb') as f:
+                    body = f.read()
+                etag = 'W/"%x-%x"' % (stat[8], stat[6])
+                # Header je Seite einmal anlegen, inkl. Content-Length (sonst pro Request str(len(body)))
+                pages[name] = (body, etag, {
+                    'Content-Type': 'text/html; charset=UTF-8',
+                    'Content-Length': str(len(body)),
+                    'ETag': etag,
+                    'Cache-Control': _STATIC_CACHE_CONTROL,
+                })
+            except (OSError, MemoryError) as e:
+                # Nicht gecachte Seiten werden in index() direkt aus der Datei gestreamt
+                print(f"⚠️ Seite {file} konnte nicht geladen werden: {e}")
+        return pages
 
     async def index(self, request):
-        page = request.args.get('page', 'pickup')
-        file = self.page_files.get(page, self.page_files['pickup'])
+        # Der Kiosk ruft meist nur "/" auf: ohne Query-String direkt die Standardseite
+        if not request.query_string:
+            name = _DEFAULT_PAGE
+        else:
+            name = request.args.get('page', _DEFAULT_PAGE)
+            if name not in self.page_files:
+                name = _DEFAULT_PAGE
+        page = self.pages.get(name)
+        if page is None:
+            return self._stream_page(self.page_files[name])
+        body, etag, headers = page
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status_code=304, reason='Not Modified', headers={
+                'ETag': etag,
+                'Cache-Control': _STATIC_CACHE_CONTROL,
+            })
+        return Response(body=body, headers=headers)
+
+    def _stream_page(self, file):
+        """Sendet eine nicht gecachte Seite blockweise aus der Datei (Microdot liest und schließt sie)."""
         try:
-            return send_file(file, max_age=0)
-        except Exception as e:
+            f = open(file, 'rb')
+        except OSError as e:
             return f"404 - Datei nicht gefunden ({e})", 404
+        return Response(body=f, headers={'Content-Type': 'text/html; charset=UTF-8'})
 
     async def handle_post(self, request):
-        form = request.form
-        msg_content = form.get('content')
-        msg_emergency = form.get('emergency_type')
+        form = request.form # Wird von Microdot beim ersten Zugriff geparst, None ohne Formular
+        if not form:
+            return _REDIRECT_STATUS
 
+        msg_content = form.get('content')
         if msg_content:
             # Event in die Queue
             await self._event_queue.put({
                 "type": "PICKUP",
                 "value": msg_content,
             })
+            return _REDIRECT_STATUS
 
-        elif msg_emergency:
-            if msg_emergency.lower() == "staff":
-                await self._event_queue.put({
-                    "type": "EMERGENCY_CB",
-            })
-            elif msg_emergency.lower() == "medical":
-                await self._event_queue.put({
-                    "type": "EMERGENCY_EVENT",
-            })
-        return redirect('/?page=status')
+        # Notfallart nur nachschlagen, wenn kein Abholtext gesendet wurde
+        msg_emergency = form.get('emergency_type')
+        if msg_emergency:
+            # Die Seite sendet die Werte bereits klein geschrieben; lower() nur als Rückfall
+            event_type = _EMERGENCY_MAP.get(msg_emergency) or _EMERGENCY_MAP.get(msg_emergency.lower())
+            if event_type:
+                await self._event_queue.put({"type": event_type})
+        return _REDIRECT_STATUS
 
     async def show_messages(self, request):
-        msgs = self.state_manager.get_all_messages()
-        print("Sende Nachrichten:", msgs)
-        return {'messages': msgs[-5:]}
+        # Vorserialisierte Antwort aus dem StateManager, kein ujson.dumps pro Abfrage.
+        # Die Statusseite fragt regelmäßig ab: unverändert nur 304 ohne Body senden.
+        etag = self.state_manager.get_messages_etag()
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status_code=304, reason='Not Modified', headers={
+                'ETag': etag,
+                'Cache-Control': 'no-cache',
+            })
+        return Response(body=self.state_manager.get_messages_json(), headers={
+            'Content-Type': 'application/json; charset=UTF-8',
+            'ETag': etag,
+            'Cache-Control': 'no-cache',
+        })
 
     async def run(self):
-        app.route('/')(self.index)
-        app.route('/submit', methods=['POST'])(self.handle_post)
-        app.route('/messages')(self.show_messages)
-
-        wlan = network.WLAN(network.STA_IF)
-        if wlan.isconnected():
-            ip = wlan.ifconfig()[0]
+        if sta_if.isconnected():
+            ip = sta_if.ifconfig()[0]
             print(f"📡 Webserver läuft unter http://{ip}")
             await app.start_server(port=80, debug=False)
         else: